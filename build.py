@@ -4,86 +4,101 @@ Increments version, runs PyInstaller, creates Windows installer, and optionally
 creates a GitHub release.
 """
 
+import functools
+import os
 import re
 import shutil
 import subprocess
 import sys
 from pathlib import Path
 
+VERSION_PATTERN = re.compile(r'version\s*=\s*"([^"]+)"')
+# Rewrite patterns operate on raw bytes so files keep their exact encoding
+# and line endings (installer.iss and the spec are CRLF)
+PYPROJECT_VERSION_PATTERN = re.compile(rb'(version\s*=\s*)"[^"]+"')
+ISS_VERSION_PATTERN = re.compile(rb'(#define MyAppVersion\s+)"[^"]+"')
+SPEC_VERSION_PATTERN = re.compile(
+    rb"('(?:CFBundleShortVersionString|CFBundleVersion)':\s*)'[^']+'"
+)
+
 
 def get_version(pyproject_path: Path) -> str:
     """Get current version from pyproject.toml."""
     content = pyproject_path.read_text()
-    match = re.search(r'version\s*=\s*"([^"]+)"', content)
+    match = VERSION_PATTERN.search(content)
     if not match:
         raise ValueError("Could not find version in pyproject.toml")
     return match.group(1)
 
 
+# Per-part bump rules: +1 increments, 0 keeps, -1 resets to zero
+_BUMP_TABLE: dict[str, tuple[int, int, int]] = {
+    "major": (1, -1, -1),
+    "minor": (0, 1, -1),
+    "patch": (0, 0, 1),
+}
+
+
 def bump_version(version: str, part: str = "patch") -> str:
     """Bump version string. Part can be 'major', 'minor', or 'patch'."""
     parts = version.split(".")
     if len(parts) != 3:
         raise ValueError(f"Invalid version format: {version}")
 
-    major, minor, patch = map(int, parts)
-
-    if part == "major":
-        major += 1
-        minor = 0
-        patch = 0
-    elif part == "minor":
-        minor += 1
-        patch = 0
-    elif part == "patch":
-        patch += 1
-    else:
+    rule = _BUMP_TABLE.get(part)
+    if rule is None:
         raise ValueError(f"Invalid part: {part}")
 
-    return f"{major}.{minor}.{patch}"
+    bumped = (0 if delta < 0 else value + delta for value, delta in zip(map(int, parts), rule))
+    return ".".join(map(str, bumped))
+
+
+def stage_version_updates(
+    pyproject_path: Path,
+    iss_path: Path,
+    spec_path: Path,
+    new_version: str,
+) -> dict[Path, tuple[bytes, bytes]]:
+    """Compute updated version file contents in memory without writing.
+
+    Returns:
+        Mapping of path to (original, updated) bytes for files that change
+    """
+    version = new_version.encode()
+    targets = [
+        (pyproject_path, PYPROJECT_VERSION_PATTERN, b'\\1"%s"' % version),
+        (iss_path, ISS_VERSION_PATTERN, b'\\1"%s"' % version),
+        # CFBundleShortVersionString and CFBundleVersion share one pattern
+        (spec_path, SPEC_VERSION_PATTERN, b"\\1'%s'" % version),
+    ]
+    staged: dict[Path, tuple[bytes, bytes]] = {}
+    for path, pattern, replacement in targets:
+        content = path.read_bytes()
+        updated = pattern.sub(replacement, content)
+        if updated != content:
+            staged[path] = (content, updated)
+    return staged
 
 
-def update_pyproject_version(pyproject_path: Path, new_version: str) -> None:
-    """Update version in pyproject.toml."""
-    content = pyproject_path.read_text()
-    updated = re.sub(
-        r'(version\s*=\s*)"[^"]+"',
-        f'\\1"{new_version}"',
-        content,
-    )
-    pyproject_path.write_text(updated)
-    print(f"Updated pyproject.toml to version {new_version}")
+def _replace_file(path: Path, data: bytes) -> None:
+    """Atomically replace a file's content via a temp file and os.replace."""
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
 
 
-def update_iss_version(iss_path: Path, new_version: str) -> None:
-    """Update version in installer.iss."""
-    content = iss_path.read_text()
-    updated = re.sub(
-        r'(#define MyAppVersion\s+)"[^"]+"',
-        f'\\1"{new_version}"',
-        content,
-    )
-    iss_path.write_text(updated)
-    print(f"Updated installer.iss to version {new_version}")
-
-
-def update_spec_version(spec_path: Path, new_version: str) -> None:
-    """Update version in PyInstaller spec file (macOS bundle info)."""
-    content = spec_path.read_text()
-    # Update CFBundleShortVersionString
-    updated = re.sub(
-        r"('CFBundleShortVersionString':\s*)'[^']+'",
-        f"\\1'{new_version}'",
-        content,
-    )
-    # Update CFBundleVersion
-    updated = re.sub(
-        r"('CFBundleVersion':\s*)'[^']+'",
-        f"\\1'{new_version}'",
-        updated,
-    )
-    spec_path.write_text(updated)
-    print(f"Updated spec file to version {new_version}")
+def commit_version_updates(staged: dict[Path, tuple[bytes, bytes]], new_version: str) -> None:
+    """Write staged version updates to disk."""
+    for path, (_, updated) in staged.items():
+        _replace_file(path, updated)
+        print(f"Updated {path.name} to version {new_version}")
+
+
+def rollback_version_updates(staged: dict[Path, tuple[bytes, bytes]]) -> None:
+    """Restore version files to their content from before the bump."""
+    for path, (original, _) in staged.items():
+        _replace_file(path, original)
+        print(f"Restored {path.name}")
 
 
 def run_pyinstaller(spec_path: Path) -> bool:
@@ -96,6 +111,7 @@ def run_pyinstaller(spec_path: Path) -> bool:
     return result.returncode == 0
 
 
+@functools.lru_cache(maxsize=1)
 def find_inno_setup() -> Path | None:
     """Find Inno Setup compiler (iscc.exe) on Windows."""
     possible_paths = [
@@ -127,6 +143,7 @@ def run_inno_setup(iss_path: Path) -> bool:
     return result.returncode == 0
 
 
+@functools.lru_cache(maxsize=1)
 def find_gh_cli() -> Path | None:
     """Find GitHub CLI executable."""
     # Check if gh is in PATH
@@ -231,28 +248,34 @@ def main() -> int:
     current_version = get_version(pyproject_path)
     print(f"Current version: {current_version}")
 
+    # Version bumps staged in memory; rolled back if the build fails
+    staged: dict[Path, tuple[bytes, bytes]] = {}
+
     if release_only:
         new_version = current_version
         print("Skipping build, creating release only")
     elif skip_version_bump:
         new_version = current_version
         print("Skipping version bump, syncing version files")
-        # Still sync version to iss and spec (pyproject.toml is source of truth)
-        update_iss_version(iss_path, new_version)
-        update_spec_version(spec_path, new_version)
+        # Still sync version to iss and spec (pyproject.toml is source of truth,
+        # so its substitution is a no-op and it is never staged)
+        staged = stage_version_updates(pyproject_path, iss_path, spec_path, new_version)
+        commit_version_updates(staged, new_version)
     else:
         new_version = bump_version(current_version, bump_part)
         print(f"New version: {new_version}")
 
-        # Update version in all files
-        update_pyproject_version(pyproject_path, new_version)
-        update_iss_version(iss_path, new_version)
-        update_spec_version(spec_path, new_version)
+        # Compute all three updates before touching disk. They must be on disk
+        # before the build since PyInstaller bundles pyproject.toml and reads
+        # the spec, and Inno Setup reads installer.iss.
+        staged = stage_version_updates(pyproject_path, iss_path, spec_path, new_version)
+        commit_version_updates(staged, new_version)
 
     if not release_only:
         # Run PyInstaller
         if not run_pyinstaller(spec_path):
             print("\nPyInstaller failed!")
+            rollback_version_updates(staged)
             return 1
 
         print("\nPyInstaller completed successfully!")
@@ -264,6 +287,7 @@ def main() -> int:
                 print(f"\nInstaller created in: {installer_dir}")
             else:
                 print("\nInno Setup failed or not available")
+                rollback_version_updates(staged)
                 return 1
 
         print(f"\nBuild completed! Version: {new_version}")
@@ -1,12 +1,16 @@
 #!/usr/bin/env python
 """CLI tool to de-anonymize GGPoker hand histories using screenshots."""
 import argparse
+import logging
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 from image_analyzer import (
-    analyze_screenshot,
-    detect_button_position,
+    analyze_image_cached,
+    PlayerRegion,
+    RateLimiter,
     ScreenshotFilename,
     SIX_PLAYER_REGIONS,
     FIVE_PLAYER_REGIONS,
@@ -21,20 +25,78 @@ from hand_history import (
     write_converted_file,
     write_skipped_file,
 )
-import cv2
+
+log = logging.getLogger("convert")
+
+DEFAULT_CONCURRENCY = 5
+DEFAULT_RATE_LIMIT = 50  # requests per minute
+
+
+def _positive_int(value: str) -> int:
+    """argparse type for options that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer: {value!r}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def _list_files(directory: Path, suffix: str) -> list[os.DirEntry]:
+    """List regular files in a directory whose name ends with suffix.
+
+    Uses os.scandir so file type checks come from the directory read
+    itself instead of a separate stat per entry. The suffix is compared
+    through os.path.normcase, so it is case-insensitive on Windows like
+    glob and the GUI's fnmatch listing.
+    """
+    suffix = os.path.normcase(suffix)
+    with os.scandir(directory) as entries:
+        return [
+            entry for entry in entries
+            if entry.is_file() and os.path.normcase(entry.name).endswith(suffix)
+        ]
+
+
+def _process_screenshot(
+    screenshot_path: Path,
+    regions: tuple[PlayerRegion, ...],
+    api_key: str | None,
+    rate_limiter: RateLimiter,
+    use_cache: bool = True,
+) -> tuple[dict[str, str], str | None]:
+    """Run OCR and button detection on a single screenshot.
+
+    Returns:
+        Tuple of (position_names, button_position)
+    """
+    return analyze_image_cached(
+        screenshot_path.read_bytes(), regions, api_key, rate_limiter, use_cache
+    )
 
 
 def process_screenshots(
     screenshots_dir: Path,
     hands_dir: Path,
     api_key: str | None = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    use_cache: bool = True,
+    rate_limit_per_minute: int = DEFAULT_RATE_LIMIT,
 ) -> dict[str, OcrData]:
     """Process all screenshots and extract hand numbers + player names.
 
+    Screenshots are analyzed concurrently since each one is an independent
+    network round-trip to the LLM provider. Requests are spaced to stay under
+    the rate limit and retried with backoff when the provider still rejects them.
+
     Args:
         screenshots_dir: Directory containing screenshot files
         hands_dir: Directory containing hand history files (used to determine table type)
         api_key: API key for LLM provider
+        concurrency: Maximum number of screenshots analyzed in parallel
+        use_cache: Reuse OCR results cached on disk from earlier runs
+        rate_limit_per_minute: Maximum LLM requests started per minute
 
     Returns:
         Dict mapping hand number to OcrData (position_names, table_type, button_position)
@@ -42,52 +104,56 @@ def process_screenshots(
     result: dict[str, OcrData] = {}
 
     # Determine table type from hand history filenames
-    txt_files = list(hands_dir.glob("*.txt"))
-    if not txt_files:
-        print("Error: No hand history files found")
+    txt_entries = _list_files(hands_dir, ".txt")
+    if not txt_entries:
+        log.error("Error: No hand history files found")
         return result
 
     try:
-        table_type = parse_table_type_from_filename(txt_files[0].name)
+        table_type = parse_table_type_from_filename(txt_entries[0].name)
         regions = SIX_PLAYER_REGIONS if table_type == TableType.SIX_PLAYER else FIVE_PLAYER_REGIONS
-        print(f"Table type from filename: {table_type.value}")
+        log.info(f"Table type from filename: {table_type.value}")
     except InvalidTableTypeError as e:
-        print(f"Error: {e}")
+        log.error(f"Error: {e}")
         return result
 
-    png_files = list(screenshots_dir.glob("*.png"))
-    valid_files = [f for f in png_files if ScreenshotFilename.is_valid(f.name)]
-
-    print(f"Found {len(valid_files)} valid screenshots")
-
-    for i, screenshot_path in enumerate(valid_files, 1):
-        print(f"Processing screenshot {i}/{len(valid_files)}: {screenshot_path.name}")
-
-        try:
-            parsed = ScreenshotFilename.parse(screenshot_path)
-            if not parsed:
-                print("  Error: Invalid filename format")
+    # Parse each filename once; parse() returns None for invalid names.
+    # Path objects are only built for files that passed validation.
+    parsed_files = [
+        (entry, ScreenshotFilename.parse(entry.name))
+        for entry in _list_files(screenshots_dir, ".png")
+    ]
+    valid_files = [(Path(entry.path), parsed) for entry, parsed in parsed_files if parsed]
+
+    log.info(f"Found {len(valid_files)} valid screenshots")
+
+    rate_limiter = RateLimiter(rate_limit_per_minute)
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        futures = {
+            executor.submit(
+                _process_screenshot, screenshot_path, regions, api_key, rate_limiter, use_cache
+            ): (screenshot_path, parsed)
+            for screenshot_path, parsed in valid_files
+        }
+
+        for i, future in enumerate(as_completed(futures), 1):
+            screenshot_path, parsed = futures[future]
+            log.info(f"Processed screenshot {i}/{len(valid_files)}: {screenshot_path.name}")
+
+            try:
+                position_names, button_position = future.result()
+            except Exception as e:
+                log.error(f"  Error: {e}")
                 continue
 
             hand_number = f"OM{parsed.table_id}"
-
-            image = cv2.imread(str(screenshot_path))
-            if image is None:
-                print("  Error: Could not load image")
-                continue
-
-            position_names = analyze_screenshot(screenshot_path, regions=regions, api_key=api_key)
-            button_position = detect_button_position(image, regions)
-
             result[hand_number] = OcrData(
                 position_names=position_names,
                 table_type=table_type,
                 button_position=button_position,
             )
-            print(f"  Hand #{hand_number}: {len(position_names)} players ({table_type.value})")
-
-        except Exception as e:
-            print(f"  Error: {e}")
+            log.info(f"  Hand #{hand_number}: {len(position_names)} players ({table_type.value})")
 
     return result
 
@@ -119,25 +185,25 @@ def process_hands(
     converted_dir = output_dir / "converted"
     skipped_dir = output_dir / "skipped"
 
-    txt_files = list(hands_dir.glob("*.txt"))
-    print(f"\nFound {len(txt_files)} hand history files")
+    txt_files = [Path(entry.path) for entry in _list_files(hands_dir, ".txt")]
+    log.info(f"\nFound {len(txt_files)} hand history files")
 
     # Step 1: Parse all hands from all files, tracking origin file
     all_hands = []
     hand_to_file: dict[str, Path] = {}
 
     for hand_file in txt_files:
-        print(f"Parsing: {hand_file.name}")
+        log.info(f"Parsing: {hand_file.name}")
         try:
             hands = parse_file(hand_file)
-            print(f"  Found {len(hands)} hands")
+            log.info(f"  Found {len(hands)} hands")
             for hand in hands:
                 hand_to_file[hand.hand_number] = hand_file
             all_hands.extend(hands)
         except Exception as e:
-            print(f"  Error: {e}")
+            log.error(f"  Error: {e}")
 
-    print(f"\nTotal hands parsed: {len(all_hands)}")
+    log.info(f"\nTotal hands parsed: {len(all_hands)}")
 
     if not all_hands:
         return 0, 0
@@ -161,21 +227,19 @@ def process_hands(
         if not results_for_file:
             continue
 
-        successful = [r for r in results_for_file if r.success]
-        failed = [r for r in results_for_file if not r.success]
+        # The writers only create their file once a matching result is seen
+        write_converted_file(results_for_file, converted_dir / hand_file.name)
+        write_skipped_file(results_for_file, skipped_dir / hand_file.name)
 
+        successful = sum(1 for r in results_for_file if r.success)
+        failed = len(results_for_file) - successful
         if successful:
-            output_path = converted_dir / hand_file.name
-            write_converted_file(results_for_file, output_path)
-            print(f"Converted {len(successful)} hands from {hand_file.name}")
-
+            log.info(f"Converted {successful} hands from {hand_file.name}")
         if failed:
-            output_path = skipped_dir / hand_file.name
-            write_skipped_file(results_for_file, output_path)
-            print(f"Skipped {len(failed)} hands from {hand_file.name}")
+            log.info(f"Skipped {failed} hands from {hand_file.name}")
 
-        total_success += len(successful)
-        total_failed += len(failed)
+        total_success += successful
+        total_failed += failed
 
     return total_success, total_failed
 
@@ -185,6 +249,9 @@ def main(
     screenshots_dir: Path,
     output_dir: Path,
     api_key: str | None = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    use_cache: bool = True,
+    rate_limit_per_minute: int = DEFAULT_RATE_LIMIT,
 ) -> int:
     """Main entry point for hand history de-anonymization.
 
@@ -193,37 +260,42 @@ def main(
         screenshots_dir: Directory containing .png screenshot files
         output_dir: Output directory for converted files
         api_key: API key for LLM provider
+        concurrency: Maximum number of screenshots analyzed in parallel
+        use_cache: Reuse OCR results cached on disk from earlier runs
+        rate_limit_per_minute: Maximum LLM requests started per minute
 
     Returns:
         Exit code (0 for success)
     """
     if not hands_dir.exists():
-        print(f"Error: Hands directory not found: {hands_dir}")
+        log.error(f"Error: Hands directory not found: {hands_dir}")
         return 1
 
     if not screenshots_dir.exists():
-        print(f"Error: Screenshots directory not found: {screenshots_dir}")
+        log.error(f"Error: Screenshots directory not found: {screenshots_dir}")
         return 1
 
-    print("=== Hand History De-anonymizer ===\n")
-    print(f"Hands:       {hands_dir}")
-    print(f"Screenshots: {screenshots_dir}")
-    print(f"Output:      {output_dir}\n")
+    log.info("=== Hand History De-anonymizer ===\n")
+    log.info(f"Hands:       {hands_dir}")
+    log.info(f"Screenshots: {screenshots_dir}")
+    log.info(f"Output:      {output_dir}\n")
 
-    print("Step 1: Processing screenshots...")
-    ocr_data = process_screenshots(screenshots_dir, hands_dir, api_key)
-    print(f"\nExtracted data for {len(ocr_data)} hands\n")
+    log.info("Step 1: Processing screenshots...")
+    ocr_data = process_screenshots(
+        screenshots_dir, hands_dir, api_key, concurrency, use_cache, rate_limit_per_minute
+    )
+    log.info(f"\nExtracted data for {len(ocr_data)} hands\n")
 
     if not ocr_data:
-        print("No screenshot data extracted. Nothing to convert.")
+        log.info("No screenshot data extracted. Nothing to convert.")
         return 1
 
-    print("Step 2: Converting hand histories (with mapping propagation)...")
+    log.info("Step 2: Converting hand histories (with mapping propagation)...")
     success, failed = process_hands(hands_dir, ocr_data, output_dir)
 
-    print("\n=== Summary ===")
-    print(f"Converted: {success} hands")
-    print(f"Skipped:   {failed} hands")
+    log.info("\n=== Summary ===")
+    log.info(f"Converted: {success} hands")
+    log.info(f"Skipped:   {failed} hands")
 
     return 0
 
@@ -256,7 +328,33 @@ if __name__ == "__main__":
         default=None,
         help="API key for LLM provider (uses ANTHROPIC_API_KEY env var if not set)",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Number of screenshots to analyze in parallel (default: {DEFAULT_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--rate-limit",
+        type=_positive_int,
+        default=DEFAULT_RATE_LIMIT,
+        help=f"Maximum API requests per minute (default: {DEFAULT_RATE_LIMIT})",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore cached OCR results and re-analyze every screenshot",
+    )
 
     args = parser.parse_args()
-
-    sys.exit(main(args.hands, args.screenshots, args.output, args.api_key))
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+
+    sys.exit(main(
+        args.hands,
+        args.screenshots,
+        args.output,
+        args.api_key,
+        args.concurrency,
+        use_cache=not args.no_cache,
+        rate_limit_per_minute=args.rate_limit,
+    ))
@@ -1,4 +1,5 @@
 """E2E test: Run 20 random screenshots through Anthropic API."""
+import os
 import random
 from pathlib import Path
 
@@ -12,11 +13,24 @@ NUM_SAMPLES = 20
 
 
 def main():
-    all_images = sorted(SCREENSHOTS_DIR.glob("*.png"))
-    print(f"Found {len(all_images)} images in {SCREENSHOTS_DIR}")
-
-    random.seed(42)
-    selected = random.sample(all_images, min(NUM_SAMPLES, len(all_images)))
+    # Reservoir sampling (Algorithm R): one pass, only NUM_SAMPLES paths kept
+    rng = random.Random(42)
+    reservoir: list[str] = []
+    total = 0
+    with os.scandir(SCREENSHOTS_DIR) as entries:
+        for entry in entries:
+            if not (entry.is_file() and os.path.normcase(entry.name).endswith(".png")):
+                continue
+            if len(reservoir) < NUM_SAMPLES:
+                reservoir.append(entry.path)
+            else:
+                j = rng.randrange(total + 1)
+                if j < NUM_SAMPLES:
+                    reservoir[j] = entry.path
+            total += 1
+    print(f"Found {total} images in {SCREENSHOTS_DIR}")
+
+    selected = [Path(path) for path in reservoir]
 
     print(f"\nTesting {len(selected)} random images:\n")
     print("=" * 80)
@@ -1,4 +1,5 @@
 """Application entry point with dark theme support."""
+import functools
 import sys
 from pathlib import Path
 
@@ -7,31 +8,33 @@ from PySide6.QtGui import QPalette, QColor, QIcon
 from PySide6.QtWidgets import QApplication
 
 from gui.main_window import MainWindow
+from gui.styles import GLOBAL_QSS
 
 
+_ICON_CANDIDATES = (
+    Path(__file__).parent.parent / "app.ico",  # Development: project root
+    Path(sys.executable).parent / "app.ico",   # PyInstaller: next to exe
+    Path(__file__).parent / "app.ico",         # Fallback: gui folder
+)
+
+
+@functools.cache
 def get_icon_path() -> Path | None:
     """Get path to app icon, checking multiple locations."""
-    # PyInstaller stores bundled files in sys._MEIPASS
-    if hasattr(sys, "_MEIPASS"):
-        bundled = Path(sys._MEIPASS) / "app.ico"
-        if bundled.exists():
-            return bundled
-
-    candidates = [
-        Path(__file__).parent.parent / "app.ico",  # Development: project root
-        Path(sys.executable).parent / "app.ico",   # PyInstaller: next to exe
-        Path(__file__).parent / "app.ico",         # Fallback: gui folder
-    ]
-    for path in candidates:
+    # PyInstaller stores bundled files in sys._MEIPASS; the spec always
+    # bundles app.ico there, so frozen builds skip the filesystem checks
+    if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
+        return Path(sys._MEIPASS) / "app.ico"
+
+    for path in _ICON_CANDIDATES:
         if path.exists():
             return path
     return None
 
 
-def apply_dark_theme(app: QApplication) -> None:
-    """Apply a dark color palette to the application."""
-    app.setStyle("Fusion")
-
+@functools.cache
+def _dark_palette() -> QPalette:
+    """Build the dark color palette once and reuse it."""
     palette = QPalette()
 
     palette.setColor(QPalette.ColorRole.Window, QColor(53, 53, 53))
@@ -52,7 +55,14 @@ def apply_dark_theme(app: QApplication) -> None:
     palette.setColor(QPalette.ColorGroup.Disabled, QPalette.ColorRole.Text, QColor(127, 127, 127))
     palette.setColor(QPalette.ColorGroup.Disabled, QPalette.ColorRole.ButtonText, QColor(127, 127, 127))
 
-    app.setPalette(palette)
+    return palette
+
+
+def apply_dark_theme(app: QApplication) -> None:
+    """Apply a dark color palette and the shared widget stylesheet."""
+    app.setStyle("Fusion")
+    app.setPalette(_dark_palette())
+    app.setStyleSheet(GLOBAL_QSS)
 
 
 def launch_app() -> int:
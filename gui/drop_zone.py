@@ -2,7 +2,7 @@
 from pathlib import Path
 
 from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QDragEnterEvent, QDropEvent, QMouseEvent
+from PySide6.QtGui import QDragEnterEvent, QDropEvent, QMouseEvent, QResizeEvent
 from PySide6.QtWidgets import QFrame, QLabel, QVBoxLayout, QFileDialog, QStackedWidget, QSizePolicy
 
 
@@ -19,40 +19,32 @@ class DropZone(QFrame):
         self._file_mode = False
         self._folder_path: Path | None = None
         self._file_path: Path | None = None
+        self._home_str = str(Path.home())
+        self._path_text = ""
         self._setup_ui()
         self.setAcceptDrops(True)
 
     def _setup_ui(self) -> None:
         self.setFrameStyle(QFrame.Shape.StyledPanel | QFrame.Shadow.Sunken)
         self.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Preferred)
-        self.setStyleSheet("""
-            DropZone {
-                border: 2px dashed #666;
-                border-radius: 8px;
-                background-color: #2a2a2a;
-                min-height: 80px;
-            }
-            DropZone:hover {
-                border-color: #888;
-                background-color: #333;
-            }
-        """)
+        self.setProperty("dragActive", False)
 
         layout = QVBoxLayout(self)
         layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         self._title_label = QLabel(self._label_text)
         self._title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self._title_label.setStyleSheet("font-weight: bold; font-size: 14px;")
+        self._title_label.setObjectName("DropZoneTitle")
 
         self._hint_label = QLabel("Drop folder here\nor click to browse")
         self._hint_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self._hint_label.setStyleSheet("color: #888;")
+        self._hint_label.setObjectName("DropZoneHint")
 
         self._path_label = QLabel("")
         self._path_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self._path_label.setStyleSheet("color: #4a9eff;")
-        self._path_label.setWordWrap(True)
+        self._path_label.setObjectName("DropZonePath")
+        # Single line, elided to the available width; full path in the tooltip
+        self._path_label.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Preferred)
 
         self._content_stack = QStackedWidget()
         self._content_stack.addWidget(self._hint_label)
@@ -85,6 +77,17 @@ class DropZone(QFrame):
     def is_file_mode(self) -> bool:
         return self._file_mode
 
+    def _set_drag_active(self, active: bool) -> None:
+        """Toggle the drag highlight via a dynamic property.
+
+        Re-polishes only when the state changes instead of re-parsing the
+        stylesheet on every drag event.
+        """
+        if self.property("dragActive") == active:
+            return
+        self.setProperty("dragActive", active)
+        self.style().polish(self)
+
     def dragEnterEvent(self, event: QDragEnterEvent) -> None:
         if event.mimeData().hasUrls():
             urls = event.mimeData().urls()
@@ -93,20 +96,20 @@ class DropZone(QFrame):
                 if self._file_mode:
                     if path.is_file() and path.suffix == ".toml":
                         event.acceptProposedAction()
-                        self.setStyleSheet(self.styleSheet().replace("#2a2a2a", "#3a3a4a"))
+                        self._set_drag_active(True)
                         return
                 else:
                     if path.is_dir():
                         event.acceptProposedAction()
-                        self.setStyleSheet(self.styleSheet().replace("#2a2a2a", "#3a3a4a"))
+                        self._set_drag_active(True)
                         return
         event.ignore()
 
     def dragLeaveEvent(self, event) -> None:
-        self.setStyleSheet(self.styleSheet().replace("#3a3a4a", "#2a2a2a"))
+        self._set_drag_active(False)
 
     def dropEvent(self, event: QDropEvent) -> None:
-        self.setStyleSheet(self.styleSheet().replace("#3a3a4a", "#2a2a2a"))
+        self._set_drag_active(False)
         urls = event.mimeData().urls()
         if urls:
             path = Path(urls[0].toLocalFile())
@@ -123,7 +126,7 @@ class DropZone(QFrame):
         if event.button() == Qt.MouseButton.LeftButton:
             if self._file_mode:
                 current = self.get_file()
-                start_dir = str(current.parent) if current and current.exists() else str(Path.home())
+                start_dir = str(current.parent) if current else self._home_str
                 file_path, _ = QFileDialog.getOpenFileName(
                     self,
                     "Select OCR Dump File",
@@ -134,21 +137,39 @@ class DropZone(QFrame):
                     self._set_file(Path(file_path))
             else:
                 current = self.get_folder()
-                start_dir = str(current) if current and current.exists() else str(Path.home())
+                start_dir = str(current) if current else self._home_str
                 folder = QFileDialog.getExistingDirectory(
                     self,
                     f"Select {self._label_text} Folder",
                     start_dir,
+                    QFileDialog.Option.ShowDirsOnly | QFileDialog.Option.DontResolveSymlinks,
                 )
                 if folder:
                     self._set_folder(Path(folder))
 
+    def _elide_path(self) -> None:
+        # The stack is laid out even while the path page is hidden
+        width = self._content_stack.width() or 300
+        elided = self._path_label.fontMetrics().elidedText(
+            self._path_text, Qt.TextElideMode.ElideMiddle, width
+        )
+        self._path_label.setText(elided)
+
+    def resizeEvent(self, event: QResizeEvent) -> None:
+        super().resizeEvent(event)
+        if self._path_text:
+            self._elide_path()
+
     def _show_path(self, path: Path) -> None:
-        self._path_label.setText(str(path))
+        self._path_text = str(path)
+        self._path_label.setToolTip(self._path_text)
+        self._elide_path()
         self._content_stack.setCurrentWidget(self._path_label)
 
     def _clear_display(self) -> None:
+        self._path_text = ""
         self._path_label.setText("")
+        self._path_label.setToolTip("")
         self._content_stack.setCurrentWidget(self._hint_label)
 
     def _set_folder(self, path: Path) -> None:
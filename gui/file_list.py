@@ -1,36 +1,208 @@
 """File list widget for previewing files in a folder."""
+import fnmatch
+import os
+import re
 from pathlib import Path
 from typing import Callable
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import (
+    QAbstractListModel,
+    QModelIndex,
+    QRunnable,
+    Qt,
+    QThreadPool,
+    QTimer,
+    Signal,
+)
 from PySide6.QtGui import QColor
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QHBoxLayout,
     QLabel,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
     QPushButton,
 )
 
 
+def scan_folder_names(path: Path, pattern: str) -> list[str] | None:
+    """List sorted names of files in a folder matching pattern.
+
+    Safe to call from a worker thread.
+
+    Returns:
+        Sorted file names, or None if the folder is missing
+    """
+    if not path.exists():
+        return None
+
+    # Filter and sort plain names; normcase keeps Windows ordering
+    # case-insensitive like sorted Path objects
+    with os.scandir(path) as entries:
+        names = [e.name for e in entries if e.is_file()]
+    return sorted(fnmatch.filter(names, pattern), key=os.path.normcase)
+
+
+def scan_folder_files(
+    path: Path,
+    pattern: str,
+    validate: Callable[[str], object] | None = None,
+) -> tuple[list[Path], list[bool]] | None:
+    """List files in a folder matching pattern, with a validity flag each.
+
+    Safe to call from a worker thread.
+
+    Returns:
+        Tuple of (sorted paths, validity flags), or None if the folder is missing
+    """
+    names = scan_folder_names(path, pattern)
+    if names is None:
+        return None
+
+    if validate:
+        valid = list(map(bool, map(validate, names)))
+    else:
+        valid = [True] * len(names)
+    return [path / name for name in names], valid
+
+
+def _listing_key(path: Path, pattern: str) -> tuple[Path, str, int] | None:
+    """Identify a folder listing; the directory mtime changes on add, remove or rename."""
+    try:
+        return path, pattern, os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+# Reported by _ScanTask instead of a listing when the folder hasn't changed
+_UNCHANGED = object()
+
+
+class _ScanTask(QRunnable):
+    """Runs scan_folder_files on the thread pool and reports back via a signal.
+
+    The folder is stat'ed here too, never on the GUI thread, since a slow
+    network share can block for as long as the stat takes to time out.
+    """
+
+    def __init__(
+        self,
+        widget: "FileListWidget",
+        token: int,
+        path: Path,
+        pattern: str,
+        previous_key: tuple[Path, str, int] | None = None,
+    ):
+        super().__init__()
+        self._widget = widget
+        self._token = token
+        self._path = path
+        self._pattern = pattern
+        self._validate = widget._validate
+        self._previous_key = previous_key
+        self.listing_key: tuple[Path, str, int] | None = None
+
+    def run(self) -> None:
+        # Keyed before listing so changes made during the scan trigger a rescan
+        self.listing_key = _listing_key(self._path, self._pattern)
+        if self.listing_key is not None and self.listing_key == self._previous_key:
+            result = _UNCHANGED
+        else:
+            try:
+                result = scan_folder_files(self._path, self._pattern, self._validate)
+            except OSError:
+                result = None
+        try:
+            # Emitted from the pool thread, so delivery to the widget is queued
+            self._widget._scan_finished.emit(self._token, result)
+        except RuntimeError:
+            pass  # Widget was deleted while the scan was running
+
+
+class FileListModel(QAbstractListModel):
+    """List model backed by plain Python lists of paths and validity flags.
+
+    The view only asks for data of visible rows, so no per-file Qt objects
+    are created regardless of folder size.
+    """
+
+    _INVALID_COLOR = QColor("#666")
+    _INVALID_TOOLTIP = "Invalid file format"
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._paths: list[Path] = []
+        self._valid: list[bool] = []
+        self._valid_count = 0
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._paths)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._paths[row].name
+        if role == Qt.ItemDataRole.UserRole:
+            return str(self._paths[row])
+        if not self._valid[row]:
+            if role == Qt.ItemDataRole.ForegroundRole:
+                return self._INVALID_COLOR
+            if role == Qt.ItemDataRole.ToolTipRole:
+                return self._INVALID_TOOLTIP
+        return None
+
+    def set_files(self, paths: list[Path], valid: list[bool]) -> None:
+        """Replace all rows in a single model reset."""
+        self.beginResetModel()
+        self._paths = paths
+        self._valid = valid
+        self._valid_count = sum(valid)
+        self.endResetModel()
+
+    def paths(self) -> list[Path]:
+        return list(self._paths)
+
+    def valid_paths(self) -> list[Path]:
+        return [p for p, v in zip(self._paths, self._valid) if v]
+
+    def valid_count(self) -> int:
+        return self._valid_count
+
+
 class FileListWidget(QWidget):
     """A widget showing a list of files with optional validation."""
 
     refresh_clicked = Signal()
+    populated = Signal(int)  # valid count, after an async scan_folder completes
+    _scan_finished = Signal(int, object)
+
+    # Clicks within this window collapse into a single refresh_clicked
+    REFRESH_DEBOUNCE_MS = 100
 
     def __init__(
         self,
         title: str,
-        validator: Callable[[str], bool] | None = None,
+        validator: re.Pattern[str] | Callable[[str], bool] | None = None,
         parent=None,
     ):
         super().__init__(parent)
         self._title = title
-        self._validator = validator
+        # A compiled pattern is matched directly, skipping a Python-level call
+        self._validate = validator.match if isinstance(validator, re.Pattern) else validator
         self._current_folder: Path | None = None
         self._current_pattern: str | None = None
+        # Bumped on every populate so results from superseded scans are dropped
+        self._scan_token = 0
+        self._scan_tasks: dict[int, _ScanTask] = {}
+        # Listing currently shown, so unchanged folders aren't rescanned
+        self._listing_key: tuple[Path, str, int] | None = None
+        self._scan_finished.connect(self._on_scan_finished)
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(self.REFRESH_DEBOUNCE_MS)
+        self._refresh_timer.timeout.connect(self.refresh_clicked.emit)
         self._setup_ui()
 
     def _setup_ui(self) -> None:
@@ -41,42 +213,24 @@ class FileListWidget(QWidget):
         header_layout.setContentsMargins(0, 0, 0, 0)
 
         self._header = QLabel(f"{self._title} (0 files)")
-        self._header.setStyleSheet("font-weight: bold;")
+        self._header.setObjectName("FileListHeader")
 
         self._refresh_btn = QPushButton("⟳")
         self._refresh_btn.setFixedSize(24, 24)
         self._refresh_btn.setToolTip("Refresh file list")
-        self._refresh_btn.setStyleSheet("""
-            QPushButton {
-                border: none;
-                border-radius: 4px;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #444;
-            }
-        """)
-        self._refresh_btn.clicked.connect(self.refresh_clicked.emit)
+        self._refresh_btn.setObjectName("FileListRefresh")
+        self._refresh_btn.clicked.connect(self._refresh_timer.start)
 
         header_layout.addWidget(self._header)
         header_layout.addWidget(self._refresh_btn)
         header_layout.addStretch()
 
-        self._list = QListWidget()
+        self._model = FileListModel(self)
+        self._list = QListView()
+        self._list.setModel(self._model)
+        self._list.setUniformItemSizes(True)
         self._list.setAlternatingRowColors(True)
-        self._list.setStyleSheet("""
-            QListWidget {
-                background-color: #1a1a1a;
-                border: 1px solid #444;
-                border-radius: 4px;
-            }
-            QListWidget::item {
-                padding: 4px;
-            }
-            QListWidget::item:alternate {
-                background-color: #222;
-            }
-        """)
+        self._list.setObjectName("FileList")
 
         layout.addLayout(header_layout)
         layout.addWidget(self._list)
@@ -93,33 +247,73 @@ class FileListWidget(QWidget):
         """
         self._current_folder = path
         self._current_pattern = pattern
-        self._list.clear()
+        self._scan_token += 1
+        self._listing_key = None
+        return self._apply_scan(scan_folder_files(path, pattern, self._validate))
 
-        if not path.exists():
-            self._header.setText(f"{self._title} (folder not found)")
-            return 0
+    def scan_folder(self, path: Path, pattern: str, force: bool = False) -> None:
+        """Populate list with files matching pattern without blocking the GUI.
 
-        files = sorted(path.glob(pattern))
-        valid_count = 0
+        The folder is enumerated on the global thread pool; populated is
+        emitted with the valid count once the list has been filled. If the
+        folder is already shown and its mtime is unchanged, the rows are kept
+        and only the count is re-emitted.
 
-        for file_path in files:
-            item = QListWidgetItem(file_path.name)
+        Args:
+            path: Directory to scan
+            pattern: Glob pattern (e.g., "*.png")
+            force: Rescan even if the folder looks unchanged; directory mtime
+                isn't reliable on FAT/exFAT or cached network mounts
+        """
+        self._current_folder = path
+        self._current_pattern = pattern
+        previous_key = self._listing_key
+        if force or previous_key is None or previous_key[:2] != (path, pattern):
+            previous_key = None
+            # Drop the previous rows so counts never describe the old folder
+            self._model.set_files([], [])
+            self._header.setText(f"{self._title} (scanning…)")
+
+        self._scan_token += 1
+        self._listing_key = None
+        # Keep the Python-side task alive ourselves instead of letting the pool
+        # delete it from the worker thread
+        task = _ScanTask(self, self._scan_token, path, pattern, previous_key)
+        task.setAutoDelete(False)
+        self._scan_tasks[self._scan_token] = task
+        QThreadPool.globalInstance().start(task)
+
+    def _on_scan_finished(self, token: int, result: object) -> None:
+        task = self._scan_tasks.pop(token, None)
+        if token != self._scan_token:
+            return
+        if task is not None and result is not None:
+            self._listing_key = task.listing_key
+        if result is _UNCHANGED:
+            self.populated.emit(self._show_counts())
+        else:
+            self.populated.emit(self._apply_scan(result))
 
-            is_valid = True
-            if self._validator:
-                is_valid = self._validator(file_path.name)
+    def _apply_scan(self, result: tuple[list[Path], list[bool]] | None) -> int:
+        """Load scan results into the model and update the header.
 
-            if is_valid:
-                valid_count += 1
-            else:
-                item.setForeground(QColor("#666"))
-                item.setToolTip("Invalid file format")
+        Returns:
+            Count of valid files
+        """
+        if result is None:
+            self._model.set_files([], [])
+            self._header.setText(f"{self._title} (folder not found)")
+            return 0
 
-            item.setData(Qt.ItemDataRole.UserRole, str(file_path))
-            self._list.addItem(item)
+        files, valid = result
+        self._model.set_files(files, valid)
+        return self._show_counts()
 
-        total = len(files)
-        if self._validator and valid_count != total:
+    def _show_counts(self) -> int:
+        """Update the header from the model and return the valid count."""
+        valid_count = self._model.valid_count()
+        total = self._model.rowCount()
+        if self._validate and valid_count != total:
             self._header.setText(f"{self._title} ({valid_count}/{total} valid)")
         else:
             self._header.setText(f"{self._title} ({total} files)")
@@ -127,7 +321,9 @@ class FileListWidget(QWidget):
         return valid_count
 
     def clear(self) -> None:
-        self._list.clear()
+        self._scan_token += 1
+        self._listing_key = None
+        self._model.set_files([], [])
         self._header.setText(f"{self._title} (0 files)")
 
     def set_title(self, title: str) -> None:
@@ -136,36 +332,17 @@ class FileListWidget(QWidget):
 
     def get_files(self) -> list[Path]:
         """Get list of all file paths (including invalid ones)."""
-        files = []
-        for i in range(self._list.count()):
-            item = self._list.item(i)
-            path_str = item.data(Qt.ItemDataRole.UserRole)
-            if path_str:
-                files.append(Path(path_str))
-        return files
+        return self._model.paths()
 
     def get_valid_files(self) -> list[Path]:
         """Get list of valid file paths only."""
-        if not self._validator:
-            return self.get_files()
-
-        files = []
-        for i in range(self._list.count()):
-            item = self._list.item(i)
-            path_str = item.data(Qt.ItemDataRole.UserRole)
-            if path_str:
-                path = Path(path_str)
-                if self._validator(path.name):
-                    files.append(path)
-        return files
+        return self._model.valid_paths()
 
     def count(self) -> int:
-        return self._list.count()
+        return self._model.rowCount()
 
     def valid_count(self) -> int:
-        if not self._validator:
-            return self.count()
-        return len(self.get_valid_files())
+        return self._model.valid_count()
 
     def refresh(self) -> int:
         """Re-read current folder if set.
@@ -1,7 +1,9 @@
 """Main application window."""
+import os
 from pathlib import Path
 
-from PySide6.QtGui import QAction, QKeySequence
+from PySide6.QtCore import QRunnable, QSignalBlocker, QThreadPool, QTimer, Signal
+from PySide6.QtGui import QAction, QKeySequence, QTextCursor
 from PySide6.QtWidgets import (
     QMainWindow,
     QWidget,
@@ -17,20 +19,66 @@ from PySide6.QtWidgets import (
     QCheckBox,
 )
 
-from image_analyzer import ScreenshotFilename
-from image_analyzer.ocr_dump import write_ocr_dump, parse_ocr_dump_to_ocr_data
+from image_analyzer import FILENAME_PATTERN
+from image_analyzer.ocr_dump import write_ocr_dump
 from hand_history import OcrData
 from settings import load_settings, save_settings
 from gui.drop_zone import DropZone
 from gui.file_list import FileListWidget
-from gui.workers import ScreenshotWorker, ConversionWorker
+from gui.workers import ScreenshotWorker, DumpLoadWorker, ConversionWorker
 from gui.settings_dialog import SettingsDialog, load_api_key
 from gui.version import get_version
 
 
+# Saved path settings and the check each must pass to be restored
+_SAVED_PATH_CHECKS = {
+    "last_screenshots_folder": os.path.isdir,
+    "last_ocr_dump_file": os.path.isfile,
+    "last_hands_folder": os.path.isdir,
+    "last_output_folder": os.path.isdir,
+}
+
+
+def check_saved_paths(settings: dict) -> dict[str, Path]:
+    """Return the saved path settings that still exist on disk.
+
+    Safe to call from a worker thread.
+    """
+    found: dict[str, Path] = {}
+    for key, check in _SAVED_PATH_CHECKS.items():
+        value = settings.get(key, "")
+        if value and check(value):
+            found[key] = Path(value)
+    return found
+
+
+class _SavedPathsTask(QRunnable):
+    """Runs check_saved_paths on the thread pool and reports back via a signal."""
+
+    def __init__(self, window: "MainWindow", settings: dict):
+        super().__init__()
+        self._window = window
+        self._settings = dict(settings)
+
+    def run(self) -> None:
+        found = check_saved_paths(self._settings)
+        try:
+            # Emitted from the pool thread, so delivery to the window is queued
+            self._window._saved_paths_checked.emit(found)
+        except RuntimeError:
+            pass  # Window was deleted while the check was running
+
+
 class MainWindow(QMainWindow):
     """Main application window with drag-drop zones and conversion controls."""
 
+    _saved_paths_checked = Signal(object)
+
+    OUTPUT_SAVE_DELAY_MS = 300
+    LOG_FLUSH_INTERVAL_MS = 100
+    LOG_MAX_BLOCKS = 5000
+    PROGRESS_INTERVAL_MS = 16
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle(f"Hand History De-anonymizer v{get_version()}")
@@ -41,13 +89,39 @@ class MainWindow(QMainWindow):
         self._hands_folder: Path | None = None
         self._output_folder: Path | None = None
         self._screenshot_worker: ScreenshotWorker | None = None
+        self._dump_worker: DumpLoadWorker | None = None
+        self._settings_dialog: SettingsDialog | None = None
+        self._api_key: str | None = None
         self._conversion_worker: ConversionWorker | None = None
         self._hand_data: dict[str, OcrData] = {}
 
+        # Typing in the output field saves once the user pauses
+        self._output_save_timer = QTimer(self)
+        self._output_save_timer.setSingleShot(True)
+        self._output_save_timer.setInterval(self.OUTPUT_SAVE_DELAY_MS)
+        self._output_save_timer.timeout.connect(self._save_output_setting)
+
+        # Log lines are buffered and appended to the QTextEdit in batches
+        self._log_buffer: list[str] = []
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(self.LOG_FLUSH_INTERVAL_MS)
+        self._log_flush_timer.timeout.connect(self._flush_log)
+
+        # Progress updates keep only the latest value until the next frame
+        self._pending_progress: tuple[QProgressBar, int, int, str] | None = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(self.PROGRESS_INTERVAL_MS)
+        self._progress_timer.timeout.connect(self._flush_progress)
+
+        # Shared by all methods; reloaded after the settings dialog saves
+        self._settings = load_settings()
+
         self._setup_menu()
         self._setup_ui()
-        self._load_saved_folders()
         self._update_convert_button()
+        self._load_saved_folders()
 
     def _setup_menu(self) -> None:
         menubar = self.menuBar()
@@ -88,11 +162,13 @@ class MainWindow(QMainWindow):
         lists_layout = QHBoxLayout()
         self._screenshots_list = FileListWidget(
             "Screenshots",
-            validator=ScreenshotFilename.is_valid,
+            validator=FILENAME_PATTERN,
         )
         self._screenshots_list.refresh_clicked.connect(self._refresh_screenshots)
+        self._screenshots_list.populated.connect(self._update_convert_button)
         self._hands_list = FileListWidget("Hand Files")
         self._hands_list.refresh_clicked.connect(self._refresh_hands)
+        self._hands_list.populated.connect(self._update_convert_button)
         lists_layout.addWidget(self._screenshots_list)
         lists_layout.addWidget(self._hands_list)
         layout.addLayout(lists_layout)
@@ -102,6 +178,7 @@ class MainWindow(QMainWindow):
         self._output_input = QLineEdit()
         self._output_input.setPlaceholderText("Select output folder...")
         self._output_input.textChanged.connect(self._on_output_changed)
+        self._output_input.editingFinished.connect(self._flush_output_setting)
         output_layout.addWidget(self._output_input)
         self._output_browse_btn = QPushButton("Browse...")
         self._output_browse_btn.clicked.connect(self._browse_output)
@@ -109,7 +186,7 @@ class MainWindow(QMainWindow):
         layout.addLayout(output_layout)
 
         self._screenshots_progress_label = QLabel("Step 1: Extracting player names")
-        self._screenshots_progress_label.setStyleSheet("font-weight: bold; margin-top: 10px;")
+        self._screenshots_progress_label.setProperty("role", "section")
         layout.addWidget(self._screenshots_progress_label)
 
         self._screenshots_progress_bar = QProgressBar()
@@ -117,7 +194,7 @@ class MainWindow(QMainWindow):
         layout.addWidget(self._screenshots_progress_bar)
 
         self._conversion_progress_label = QLabel("Step 2: Converting hand histories")
-        self._conversion_progress_label.setStyleSheet("font-weight: bold; margin-top: 10px;")
+        self._conversion_progress_label.setProperty("role", "section")
         layout.addWidget(self._conversion_progress_label)
 
         self._conversion_progress_bar = QProgressBar()
@@ -125,23 +202,17 @@ class MainWindow(QMainWindow):
         layout.addWidget(self._conversion_progress_bar)
 
         self._status_label = QLabel("Ready")
-        self._status_label.setStyleSheet("color: #888;")
+        self._status_label.setObjectName("StatusLabel")
         layout.addWidget(self._status_label)
 
         log_label = QLabel("Log")
-        log_label.setStyleSheet("font-weight: bold; margin-top: 10px;")
+        log_label.setProperty("role", "section")
         layout.addWidget(log_label)
 
         self._log = QTextEdit()
         self._log.setReadOnly(True)
-        self._log.setStyleSheet("""
-            QTextEdit {
-                background-color: #1a1a1a;
-                border: 1px solid #444;
-                border-radius: 4px;
-                font-family: monospace;
-            }
-        """)
+        self._log.document().setMaximumBlockCount(self.LOG_MAX_BLOCKS)
+        self._log.setObjectName("Log")
         layout.addWidget(self._log)
 
         button_layout = QHBoxLayout()
@@ -168,7 +239,7 @@ class MainWindow(QMainWindow):
         self._ocr_dump_path = None
         self._screenshots_list.setVisible(True)
         self._screenshots_list.set_title("Screenshots")
-        self._screenshots_list.set_folder(path, "*.png")
+        self._screenshots_list.scan_folder(path, "*.png")
         self._save_folder_setting("last_screenshots_folder", path)
         self._update_convert_button()
 
@@ -182,49 +253,75 @@ class MainWindow(QMainWindow):
 
     def _on_hands_folder_changed(self, path: Path) -> None:
         self._hands_folder = path
-        self._hands_list.set_folder(path, "*.txt")
+        self._hands_list.scan_folder(path, "*.txt")
         self._save_folder_setting("last_hands_folder", path)
         self._update_convert_button()
 
     def _on_output_changed(self, text: str) -> None:
         self._output_folder = Path(text) if text else None
         if self._output_folder:
-            self._save_folder_setting("last_output_folder", self._output_folder)
+            self._output_save_timer.start()
+        else:
+            self._output_save_timer.stop()
         self._update_convert_button()
 
-    def _save_folder_setting(self, key: str, path: Path) -> None:
-        settings = load_settings()
-        settings[key] = str(path)
-        save_settings(settings)
-
-    def _load_saved_folders(self) -> None:
-        settings = load_settings()
+    def _flush_output_setting(self) -> None:
+        """Save a pending output folder change immediately."""
+        if self._output_save_timer.isActive():
+            self._output_save_timer.stop()
+            self._save_output_setting()
 
-        screenshots = settings.get("last_screenshots_folder", "")
-        if screenshots and Path(screenshots).exists():
-            self._screenshots_drop._set_folder(Path(screenshots))
-
-        ocr_dump = settings.get("last_ocr_dump_file", "")
-        if ocr_dump and Path(ocr_dump).exists():
-            self._screenshots_drop.set_remembered_file(Path(ocr_dump))
+    def _save_output_setting(self) -> None:
+        if self._output_folder:
+            self._save_folder_setting("last_output_folder", self._output_folder)
 
-        hands = settings.get("last_hands_folder", "")
-        if hands and Path(hands).exists():
-            self._hands_drop._set_folder(Path(hands))
+    def _save_folder_setting(self, key: str, path: Path) -> None:
+        # Skip no-op writes, e.g. from restoring saved folders on startup
+        if self._settings.get(key) == str(path):
+            return
+        self._settings[key] = str(path)
+        save_settings(self._settings)
 
-        output = settings.get("last_output_folder", "")
-        if output and Path(output).exists():
-            self._output_input.setText(output)
+    def _load_saved_folders(self) -> None:
+        """Restore saved paths once a worker has checked they still exist.
+
+        Saved folders may be on slow or disconnected network drives, so the
+        stat calls stay off the GUI thread and the window shows immediately.
+        """
+        self._saved_paths_checked.connect(self._apply_saved_folders)
+        # Keep the Python-side task alive ourselves instead of letting the pool
+        # delete it from the worker thread
+        self._saved_paths_task: _SavedPathsTask | None = _SavedPathsTask(self, self._settings)
+        self._saved_paths_task.setAutoDelete(False)
+        QThreadPool.globalInstance().start(self._saved_paths_task)
+
+    def _apply_saved_folders(self, found: dict[str, Path]) -> None:
+        self._saved_paths_task = None
+        # Anything the user picked while the check ran takes precedence
+        if self._screenshots_folder is None and self._ocr_dump_path is None:
+            if "last_screenshots_folder" in found:
+                self._screenshots_drop._set_folder(found["last_screenshots_folder"])
+            if "last_ocr_dump_file" in found:
+                self._screenshots_drop.set_remembered_file(found["last_ocr_dump_file"])
+
+        if self._hands_folder is None and "last_hands_folder" in found:
+            self._hands_drop._set_folder(found["last_hands_folder"])
+
+        if not self._output_input.text() and "last_output_folder" in found:
+            output = found["last_output_folder"]
+            # Restoring the saved value must not schedule a save of it
+            with QSignalBlocker(self._output_input):
+                self._output_input.setText(str(output))
+            self._output_folder = output
+            self._update_convert_button()
 
     def _refresh_screenshots(self) -> None:
         if self._screenshots_folder:
-            self._screenshots_list.set_folder(self._screenshots_folder, "*.png")
-            self._update_convert_button()
+            self._screenshots_list.scan_folder(self._screenshots_folder, "*.png", force=True)
 
     def _refresh_hands(self) -> None:
         if self._hands_folder:
-            self._hands_list.set_folder(self._hands_folder, "*.txt")
-            self._update_convert_button()
+            self._hands_list.scan_folder(self._hands_folder, "*.txt", force=True)
 
     def _browse_output(self) -> None:
         start_dir = str(self._output_folder) if self._output_folder and self._output_folder.exists() else str(Path.home())
@@ -237,23 +334,38 @@ class MainWindow(QMainWindow):
             self._output_input.setText(folder)
 
     def _update_convert_button(self) -> None:
-        has_screenshot_input = (
-            (self._screenshots_folder is not None and self._screenshots_list.valid_count() > 0)
-            or (self._ocr_dump_path is not None and self._ocr_dump_path.exists())
-        )
+        # Cheap checks first; the dump file stat only runs when all else is ready
         enabled = (
-            has_screenshot_input
-            and self._hands_folder is not None
+            self._hands_folder is not None
             and self._output_folder is not None
             and self._hands_list.count() > 0
+            and (
+                (self._screenshots_folder is not None and self._screenshots_list.valid_count() > 0)
+                or (self._ocr_dump_path is not None and self._ocr_dump_path.exists())
+            )
         )
-        self._convert_btn.setEnabled(enabled)
+        if enabled != self._convert_btn.isEnabled():
+            self._convert_btn.setEnabled(enabled)
 
     def _show_settings(self) -> None:
-        dialog = SettingsDialog(self)
-        dialog.exec()
+        # Built once; later opens only reload the stored values
+        if self._settings_dialog is None:
+            self._settings_dialog = SettingsDialog(self)
+        else:
+            self._settings_dialog.reload()
+        self._settings_dialog.exec()
+        self._settings = load_settings()
+        self._api_key = None
+
+    def _get_api_key(self) -> str | None:
+        """Load the API key once; cleared whenever the settings dialog closes."""
+        if self._api_key is None:
+            self._api_key = load_api_key()
+        return self._api_key
 
     def _start_conversion(self) -> None:
+        self._flush_output_setting()
+        self._log_buffer.clear()
         self._log.clear()
         self._hand_data = {}
         self._screenshots_progress_bar.setValue(0)
@@ -267,25 +379,38 @@ class MainWindow(QMainWindow):
 
     def _start_conversion_from_dump(self) -> None:
         """Load OCR results from dump file and skip to Step 2."""
-        assert self._ocr_dump_path is not None
-        self._log.append("Loading OCR results from dump file...\n")
+        dump_path = self._ocr_dump_path
+        if dump_path is None:
+            self._set_processing_state(False)
+            return
+
+        self._log_line("Loading OCR results from dump file...\n")
         self._screenshots_progress_bar.setMaximum(1)
         self._screenshots_progress_bar.setValue(1)
 
-        try:
-            ocr_data = parse_ocr_dump_to_ocr_data(self._ocr_dump_path)
-            self._hand_data = ocr_data  # type: ignore[assignment]
-            self._log.append(f"Loaded data for {len(ocr_data)} hands\n")
-            self._start_conversion_step2()
-        except Exception as e:
-            self._log.append(f"Error loading dump file: {e}")
-            self._set_processing_state(False)
+        self._dump_worker = DumpLoadWorker(dump_path)
+        self._dump_worker.finished_processing.connect(self._on_dump_loaded)
+        self._dump_worker.error.connect(self._on_dump_error)
+        self._dump_worker.start()
+
+    def _on_dump_loaded(self, ocr_data: dict) -> None:
+        self._hand_data = ocr_data
+        self._log_line(f"Loaded data for {len(ocr_data)} hands\n")
+        self._start_conversion_step2()
+
+    def _on_dump_error(self, message: str) -> None:
+        self._log_line(f"Error loading dump file: {message}")
+        self._set_processing_state(False)
 
     def _start_conversion_from_screenshots(self) -> None:
         """Process screenshots via API (normal flow)."""
-        assert self._screenshots_folder is not None
-        assert self._hands_folder is not None
-        api_key = load_api_key()
+        screenshots_folder = self._screenshots_folder
+        hands_folder = self._hands_folder
+        if screenshots_folder is None or hands_folder is None:
+            self._set_processing_state(False)
+            return
+
+        api_key = self._get_api_key()
         if not api_key:
             result = QMessageBox.question(
                 self,
@@ -295,7 +420,7 @@ class MainWindow(QMainWindow):
             )
             if result == QMessageBox.StandardButton.Yes:
                 self._show_settings()
-                api_key = load_api_key()
+                api_key = self._get_api_key()
                 if not api_key:
                     self._set_processing_state(False)
                     return
@@ -303,18 +428,19 @@ class MainWindow(QMainWindow):
                 self._set_processing_state(False)
                 return
 
-        self._log.append("Step 1: Processing screenshots...\n")
+        self._log_line("Step 1: Processing screenshots...\n")
 
-        settings = load_settings()
-        parallel_calls = settings.get("parallel_api_calls", 5)
-        rate_limit = settings.get("api_rate_limit_per_minute", 50)
+        parallel_calls = self._settings.get("parallel_api_calls", 5)
+        rate_limit = self._settings.get("api_rate_limit_per_minute", 50)
+        use_cache = self._settings.get("use_ocr_cache", True)
 
         self._screenshot_worker = ScreenshotWorker(
-            self._screenshots_folder,
-            self._hands_folder,
+            screenshots_folder,
+            hands_folder,
             api_key=api_key,
             parallel_calls=parallel_calls,
             rate_limit_per_minute=rate_limit,
+            use_cache=use_cache,
         )
         self._screenshot_worker.progress.connect(self._on_screenshot_progress)
         self._screenshot_worker.result.connect(self._on_screenshot_result)
@@ -325,50 +451,82 @@ class MainWindow(QMainWindow):
     def _cancel_conversion(self) -> None:
         if self._screenshot_worker and self._screenshot_worker.isRunning():
             self._screenshot_worker.cancel()
+        if self._dump_worker and self._dump_worker.isRunning():
+            self._dump_worker.cancel()
         if self._conversion_worker and self._conversion_worker.isRunning():
             self._conversion_worker.cancel()
-        self._log.append("\n--- Cancelled ---")
+        self._progress_timer.stop()
+        self._pending_progress = None
+        self._log_line("\n--- Cancelled ---")
+        self._flush_log()
         self._set_processing_state(False)
 
+    def _log_line(self, text: str) -> None:
+        """Queue a line for the log view; flushed at most every LOG_FLUSH_INTERVAL_MS."""
+        self._log_buffer.append(text)
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    def _flush_log(self) -> None:
+        if not self._log_buffer:
+            return
+        # Inserted as plain text line by line: append() would guess rich text
+        # for the whole batch if any line (e.g. an HTML error body) looked like it
+        cursor = QTextCursor(self._log.document())
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.beginEditBlock()
+        for line in self._log_buffer:
+            if not self._log.document().isEmpty():
+                cursor.insertBlock()
+            cursor.insertText(line)
+        cursor.endEditBlock()
+        self._log_buffer.clear()
+        scrollbar = self._log.verticalScrollBar()
+        scrollbar.setValue(scrollbar.maximum())
+
     def _set_processing_state(self, processing: bool) -> None:
+        # Repaint once after all toggles; re-enabling updates schedules it
+        self.setUpdatesEnabled(False)
         self._convert_btn.setEnabled(not processing)
         self._cancel_btn.setEnabled(processing)
         self._screenshots_drop.setEnabled(not processing)
         self._hands_drop.setEnabled(not processing)
         self._output_browse_btn.setEnabled(not processing)
         self._output_input.setEnabled(not processing)
+        self.setUpdatesEnabled(True)
 
     def _on_screenshot_progress(self, current: int, total: int, filename: str) -> None:
-        self._screenshots_progress_bar.setMaximum(total)
-        self._screenshots_progress_bar.setValue(current)
-        self._status_label.setText(f"Processing: {filename} ({current}/{total})")
+        self._queue_progress(self._screenshots_progress_bar, current, total, f"Processing: {filename}")
 
     def _on_screenshot_result(self, hand_number: str, filename: str, position_count: int, seat_count: int) -> None:
-        self._log.append(f"  {filename} → #{hand_number}: {position_count} positions, {seat_count} seats")
+        self._log_line(f"  {filename} → #{hand_number}: {position_count} positions, {seat_count} seats")
 
     def _on_screenshot_error(self, filename: str, message: str) -> None:
-        self._log.append(f"  Error ({filename}): {message}")
+        self._log_line(f"  Error ({filename}): {message}")
 
     def _write_ocr_debug_file(self, results: list[dict], errors: list[dict]) -> None:
-        assert self._output_folder is not None
-        assert self._screenshots_folder is not None
+        output_folder = self._output_folder
+        screenshots_folder = self._screenshots_folder
+        if output_folder is None or screenshots_folder is None:
+            return
+
         path = write_ocr_dump(
             results=results,
             errors=errors,
-            output_path=self._output_folder,
-            screenshots_folder=self._screenshots_folder,
+            output_path=output_folder,
+            screenshots_folder=screenshots_folder,
         )
-        self._log.append(f"OCR results saved to: {path.name}")
+        self._log_line(f"OCR results saved to: {path.name}")
 
     def _on_screenshots_done(self, data: tuple) -> None:
         hand_data, ocr_results, ocr_errors = data
         self._hand_data = hand_data
-        self._log.append(f"\nExtracted data for {len(hand_data)} hands\n")
+        self._log_line(f"\nExtracted data for {len(hand_data)} hands\n")
 
         self._write_ocr_debug_file(ocr_results, ocr_errors)
 
         if not hand_data:
-            self._log.append("No screenshot data extracted. Nothing to convert.")
+            self._log_line("No screenshot data extracted. Nothing to convert.")
             self._set_processing_state(False)
             return
 
@@ -376,20 +534,23 @@ class MainWindow(QMainWindow):
 
     def _start_conversion_step2(self) -> None:
         """Start Step 2: Convert hand histories using loaded hand_data."""
-        assert self._hands_folder is not None
-        assert self._output_folder is not None
+        hands_folder = self._hands_folder
+        output_folder = self._output_folder
+        if hands_folder is None or output_folder is None:
+            self._set_processing_state(False)
+            return
 
         if not self._hand_data:
-            self._log.append("No hand data available. Nothing to convert.")
+            self._log_line("No hand data available. Nothing to convert.")
             self._set_processing_state(False)
             return
 
-        self._log.append("Step 2: Converting hand histories...\n")
+        self._log_line("Step 2: Converting hand histories...\n")
 
         self._conversion_worker = ConversionWorker(
-            self._hands_folder,
+            hands_folder,
             self._hand_data,
-            self._output_folder,
+            output_folder,
         )
         self._conversion_worker.progress.connect(self._on_conversion_progress)
         self._conversion_worker.hand_converted.connect(self._on_hand_converted)
@@ -398,21 +559,38 @@ class MainWindow(QMainWindow):
         self._conversion_worker.start()
 
     def _on_conversion_progress(self, current: int, total: int, filename: str) -> None:
-        self._conversion_progress_bar.setMaximum(total)
-        self._conversion_progress_bar.setValue(current)
-        self._status_label.setText(f"Converting: {filename} ({current}/{total})")
+        self._queue_progress(self._conversion_progress_bar, current, total, f"Converting: {filename}")
+
+    def _queue_progress(self, bar: QProgressBar, current: int, total: int, status: str) -> None:
+        """Show progress at most once per PROGRESS_INTERVAL_MS; the final step is shown immediately."""
+        self._pending_progress = (bar, current, total, status)
+        if current == total:
+            self._progress_timer.stop()
+            self._flush_progress()
+        elif not self._progress_timer.isActive():
+            self._progress_timer.start()
+
+    def _flush_progress(self) -> None:
+        if self._pending_progress is None:
+            return
+        bar, current, total, status = self._pending_progress
+        self._pending_progress = None
+        bar.setMaximum(total)
+        bar.setValue(current)
+        self._status_label.setText(f"{status} ({current}/{total})")
 
     def _on_hand_converted(self, hand_number: str, player_count: int) -> None:
-        self._log.append(f"  Hand #{hand_number}: {player_count} players matched")
+        self._log_line(f"  Hand #{hand_number}: {player_count} players matched")
 
     def _on_hand_skipped(self, hand_number: str, reason: str) -> None:
-        self._log.append(f"  Skipped #{hand_number}: {reason}")
+        self._log_line(f"  Skipped #{hand_number}: {reason}")
 
     def _on_conversion_done(self, success: int, failed: int) -> None:
-        self._log.append("\n=== Summary ===")
-        self._log.append(f"Converted: {success} hands")
-        self._log.append(f"Skipped:   {failed} hands")
-        self._log.append(f"\nOutput saved to: {self._output_folder}")
+        self._log_line("\n=== Summary ===")
+        self._log_line(f"Converted: {success} hands")
+        self._log_line(f"Skipped:   {failed} hands")
+        self._log_line(f"\nOutput saved to: {self._output_folder}")
+        self._flush_log()
 
         self._status_label.setText("Done")
         self._conversion_progress_bar.setValue(self._conversion_progress_bar.maximum())
@@ -1,4 +1,5 @@
 """Settings dialog with tabs for API key, seat mapping, and corrections."""
+import functools
 import os
 import tomllib
 from pathlib import Path
@@ -19,6 +20,7 @@ from PySide6.QtWidgets import (
     QPushButton,
     QSpinBox,
     QSlider,
+    QCheckBox,
     QTableWidget,
     QTableWidgetItem,
     QFormLayout,
@@ -28,8 +30,12 @@ from PySide6.QtWidgets import (
 )
 
 
+@functools.cache
 def _get_env_path() -> Path:
-    """Get .env path, preferring local for development, else app data dir."""
+    """Get .env path, preferring local for development, else app data dir.
+
+    Resolved once per process so every load and save uses the same file.
+    """
     local_path = Path.cwd() / ".env"
     if local_path.exists():
         return local_path
@@ -61,21 +67,37 @@ def _get_bundled_corrections_path() -> Path | None:
     return get_bundled_path("image_analyzer", "corrections.toml")
 
 
+# (path, mtime_ns, size) of the last .env file parsed, and its values
+_env_cache: tuple[tuple[Path, int, int], dict[str, str | None]] | None = None
+
+
 def load_api_key() -> str | None:
-    """Load API key from .env file."""
+    """Load API key from .env file.
+
+    The parsed file is cached in memory and only re-read when its mtime or
+    size changes.
+    """
+    global _env_cache
     env_path = _get_env_path()
-    if not env_path.exists():
+    try:
+        st = os.stat(env_path)
+    except OSError:
         return os.environ.get("ANTHROPIC_API_KEY")
-    values = dotenv_values(env_path)
+    key = (env_path, st.st_mtime_ns, st.st_size)
+    if _env_cache is None or _env_cache[0] != key:
+        _env_cache = (key, dotenv_values(env_path))
+    values = _env_cache[1]
     return values.get("ANTHROPIC_API_KEY") or os.environ.get("ANTHROPIC_API_KEY")
 
 
 def save_api_key(key: str) -> None:
     """Save API key to .env file."""
+    global _env_cache
     env_path = _get_env_path()
     if not env_path.exists():
         env_path.touch()
     set_key(str(env_path), "ANTHROPIC_API_KEY", key)
+    _env_cache = None
 
 
 DEFAULT_SEATS = {
@@ -99,25 +121,24 @@ DEFAULT_SEATS = {
 
 def load_all_seat_mappings() -> dict[str, dict[str, int]]:
     """Load seat mappings for all table types. User file takes priority over bundled."""
+    from settings import load_toml_cached
     six = TableType.SIX_PLAYER.value
     five = TableType.FIVE_PLAYER.value
 
     user_path = _get_user_seat_mapping_path()
     if user_path.exists():
-        with open(user_path, "rb") as f:
-            data = tomllib.load(f)
+        data = load_toml_cached(user_path)
         return {
-            six: data.get(six, DEFAULT_SEATS[six].copy()),
-            five: data.get(five, DEFAULT_SEATS[five].copy()),
+            six: dict(data.get(six, DEFAULT_SEATS[six])),
+            five: dict(data.get(five, DEFAULT_SEATS[five])),
         }
 
     bundled_path = _get_bundled_seat_mapping_path()
     if bundled_path:
-        with open(bundled_path, "rb") as f:
-            data = tomllib.load(f)
+        data = load_toml_cached(bundled_path)
         return {
-            six: data.get(six, DEFAULT_SEATS[six].copy()),
-            five: data.get(five, DEFAULT_SEATS[five].copy()),
+            six: dict(data.get(six, DEFAULT_SEATS[six])),
+            five: dict(data.get(five, DEFAULT_SEATS[five])),
         }
 
     return {k: v.copy() for k, v in DEFAULT_SEATS.items()}
@@ -133,17 +154,14 @@ def save_seat_mapping(mappings: dict[str, dict[str, int]]) -> None:
 
 def load_corrections() -> dict[str, str]:
     """Load corrections from TOML file. User file takes priority over bundled."""
+    from settings import load_toml_cached
     user_path = _get_user_corrections_path()
     if user_path.exists():
-        with open(user_path, "rb") as f:
-            data = tomllib.load(f)
-        return data.get("corrections", {})
+        return dict(load_toml_cached(user_path).get("corrections", {}))
 
     bundled_path = _get_bundled_corrections_path()
     if bundled_path:
-        with open(bundled_path, "rb") as f:
-            data = tomllib.load(f)
-        return data.get("corrections", {})
+        return dict(load_toml_cached(bundled_path).get("corrections", {}))
 
     return {}
 
@@ -237,6 +255,14 @@ class SettingsDialog(QDialog):
         parallel_layout.addWidget(self._parallel_label)
         layout.addLayout(parallel_layout)
 
+        self._use_cache_check = QCheckBox("Reuse cached OCR results")
+        self._use_cache_check.setChecked(True)
+        self._use_cache_check.setToolTip(
+            "Skip the API for screenshots analyzed in an earlier run. "
+            "Uncheck to re-analyze every screenshot."
+        )
+        layout.addWidget(self._use_cache_check)
+
         layout.addStretch()
 
         return widget
@@ -327,10 +353,9 @@ class SettingsDialog(QDialog):
         parallel = settings.get("parallel_api_calls", 5)
         self._parallel_slider.setValue(parallel)
         self._parallel_label.setText(str(parallel))
+        self._use_cache_check.setChecked(settings.get("use_ocr_cache", True))
 
-        api_key = load_api_key()
-        if api_key:
-            self._api_key_input.setText(api_key)
+        self._api_key_input.setText(load_api_key() or "")
 
         mappings = load_all_seat_mappings()
         for table_type, spinboxes in self._seat_spinboxes.items():
@@ -344,6 +369,10 @@ class SettingsDialog(QDialog):
             self._corrections_table.setItem(i, 0, QTableWidgetItem(misread))
             self._corrections_table.setItem(i, 1, QTableWidgetItem(correct))
 
+    def reload(self) -> None:
+        """Discard unsaved edits and show the currently stored values."""
+        self._load_values()
+
     def _toggle_key_visibility(self, checked: bool) -> None:
         if checked:
             self._api_key_input.setEchoMode(QLineEdit.EchoMode.Normal)
@@ -460,6 +489,7 @@ class SettingsDialog(QDialog):
         from settings import load_settings, save_settings
         settings = load_settings()
         settings["parallel_api_calls"] = self._parallel_slider.value()
+        settings["use_ocr_cache"] = self._use_cache_check.isChecked()
         save_settings(settings)
 
         api_key = self._api_key_input.text().strip()
@@ -0,0 +1,68 @@
+"""Application-wide stylesheet for custom widgets.
+
+Registered once on the QApplication so individual widgets don't each carry
+and re-parse their own copy.
+"""
+
+GLOBAL_QSS = """
+DropZone {
+    border: 2px dashed #666;
+    border-radius: 8px;
+    background-color: #2a2a2a;
+    min-height: 80px;
+}
+DropZone:hover {
+    border-color: #888;
+    background-color: #333;
+}
+DropZone[dragActive="true"] {
+    background-color: #3a3a4a;
+}
+QLabel#DropZoneTitle {
+    font-weight: bold;
+    font-size: 14px;
+}
+QLabel#DropZoneHint {
+    color: #888;
+}
+QLabel#DropZonePath {
+    color: #4a9eff;
+}
+
+QLabel#FileListHeader {
+    font-weight: bold;
+}
+QPushButton#FileListRefresh {
+    border: none;
+    border-radius: 4px;
+    font-size: 14px;
+}
+QPushButton#FileListRefresh:hover {
+    background-color: #444;
+}
+QListView#FileList {
+    background-color: #1a1a1a;
+    border: 1px solid #444;
+    border-radius: 4px;
+}
+QListView#FileList::item {
+    padding: 4px;
+}
+QListView#FileList::item:alternate {
+    background-color: #222;
+}
+
+QLabel[role="section"] {
+    font-weight: bold;
+    margin-top: 10px;
+}
+QLabel#StatusLabel {
+    color: #888;
+}
+QTextEdit#Log {
+    background-color: #1a1a1a;
+    border: 1px solid #444;
+    border-radius: 4px;
+    font-family: monospace;
+}
+"""
@@ -1,4 +1,5 @@
 """Version helper for displaying app version."""
+import functools
 import sys
 import tomllib
 from importlib.metadata import version, PackageNotFoundError
@@ -21,8 +22,12 @@ def _read_pyproject_version() -> str | None:
     return data.get("project", {}).get("version")
 
 
+@functools.cache
 def get_version() -> str:
-    """Get the package version from pyproject.toml, falling back to metadata."""
+    """Get the package version from pyproject.toml, falling back to metadata.
+
+    Resolved once per process; the version cannot change while running.
+    """
     pyproject_version = _read_pyproject_version()
     if pyproject_version:
         return pyproject_version
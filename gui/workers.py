@@ -1,20 +1,19 @@
 """QThread workers for background processing."""
-import threading
-import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import Callable
 
 from PySide6.QtCore import QThread, Signal
 
-import cv2
-
 from image_analyzer import (
-    analyze_image,
-    detect_button_position,
+    analyze_image_cached,
     ScreenshotFilename,
+    FILENAME_PATTERN,
+    RateLimiter,
     SIX_PLAYER_REGIONS,
     FIVE_PLAYER_REGIONS,
 )
+from image_analyzer.ocr_dump import parse_ocr_dump_to_ocr_data
 from hand_history import (
     TableType,
     InvalidTableTypeError,
@@ -24,8 +23,27 @@ from hand_history import (
     convert_hands_with_propagation,
     write_converted_file,
     write_skipped_file,
+    load_seat_mapping,
     position_to_seat,
 )
+from gui.file_list import scan_folder_names
+
+
+def _matching_files(
+    path: Path,
+    pattern: str,
+    validate: Callable[[str], object] | None = None,
+) -> list[Path]:
+    """List files in a folder matching pattern, keeping only valid ones.
+
+    Names are validated before any Path is built for them.
+    """
+    names = scan_folder_names(path, pattern)
+    if names is None:
+        return []
+    if validate:
+        names = [name for name in names if validate(name)]
+    return [path / name for name in names]
 
 
 class ScreenshotWorker(QThread):
@@ -36,9 +54,6 @@ class ScreenshotWorker(QThread):
     error = Signal(str, str)  # filename, message
     finished_processing = Signal(object)  # hand_data (use object to avoid dict serialization issues)
 
-    MAX_RETRIES = 5
-    BASE_BACKOFF = 1.0  # seconds
-
     def __init__(
         self,
         screenshots_dir: Path,
@@ -46,6 +61,7 @@ class ScreenshotWorker(QThread):
         api_key: str | None = None,
         parallel_calls: int = 5,
         rate_limit_per_minute: int = 50,
+        use_cache: bool = True,
         parent=None,
     ):
         super().__init__(parent)
@@ -53,46 +69,19 @@ class ScreenshotWorker(QThread):
         self._hands_dir = hands_dir
         self._api_key = api_key
         self._parallel_calls = parallel_calls
-        self._rate_limit_per_minute = rate_limit_per_minute
+        self._rate_limiter = RateLimiter(rate_limit_per_minute)
+        self._use_cache = use_cache
         self._cancelled = False
-        self._rate_lock = threading.Lock()
-        self._last_request_time = 0.0
 
     def cancel(self) -> None:
         self._cancelled = True
 
-    def _wait_for_rate_limit(self) -> None:
-        """Wait if needed to stay under the rate limit."""
-        min_interval = 60.0 / self._rate_limit_per_minute
-        with self._rate_lock:
-            now = time.time()
-            elapsed = now - self._last_request_time
-            if elapsed < min_interval:
-                time.sleep(min_interval - elapsed)
-            self._last_request_time = time.time()
-
-    def _call_with_backoff(self, image, regions) -> dict[str, str]:
-        """Call analyze_image with exponential backoff on rate limit errors."""
-        import anthropic
-
-        last_error: anthropic.RateLimitError | None = None
-        for attempt in range(self.MAX_RETRIES):
-            self._wait_for_rate_limit()
-            try:
-                return analyze_image(image, regions, self._api_key)
-            except anthropic.RateLimitError as e:
-                last_error = e
-                if attempt == self.MAX_RETRIES - 1:
-                    raise
-                backoff = self.BASE_BACKOFF * (2 ** attempt)
-                time.sleep(backoff)
-        raise last_error or RuntimeError("No retries attempted")
-
     def _process_screenshot(
         self,
         screenshot_path: Path,
         regions: tuple,
         table_type: TableType,
+        seat_mapping: dict[str, int],
     ) -> tuple[Path, str | None, TableType | None, dict | None, dict | None, str | None, str | None]:
         """Process single screenshot in thread pool.
 
@@ -105,13 +94,14 @@ class ScreenshotWorker(QThread):
 
             hand_number = f"OM{parsed.table_id}"
 
-            image = cv2.imread(str(screenshot_path))
-            if image is None:
-                return (screenshot_path, hand_number, None, None, None, None, "Could not load image")
-
-            position_names = self._call_with_backoff(image, regions)
-            button_position = detect_button_position(image, regions)
-            seat_names = position_to_seat(position_names, table_type)
+            position_names, button_position = analyze_image_cached(
+                screenshot_path.read_bytes(),
+                regions,
+                self._api_key,
+                self._rate_limiter,
+                self._use_cache,
+            )
+            seat_names = position_to_seat(position_names, table_type, seat_mapping)
 
             return (screenshot_path, hand_number, table_type, position_names, seat_names, button_position, None)
         except Exception as e:
@@ -123,7 +113,7 @@ class ScreenshotWorker(QThread):
         ocr_errors: list[dict] = []
 
         # Determine table type from hand history filenames
-        txt_files = list(self._hands_dir.glob("*.txt"))
+        txt_files = _matching_files(self._hands_dir, "*.txt")
         if not txt_files:
             self.error.emit("", "No hand history files found")
             self.finished_processing.emit((ocr_data, ocr_results, ocr_errors))
@@ -137,14 +127,16 @@ class ScreenshotWorker(QThread):
             self.finished_processing.emit((ocr_data, ocr_results, ocr_errors))
             return
 
-        png_files = list(self._screenshots_dir.glob("*.png"))
-        valid_files = [f for f in png_files if ScreenshotFilename.is_valid(f.name)]
+        # Loaded once here rather than per screenshot in position_to_seat
+        seat_mapping = load_seat_mapping(table_type)
+
+        valid_files = _matching_files(self._screenshots_dir, "*.png", FILENAME_PATTERN.match)
         total = len(valid_files)
         processed = 0
 
         with ThreadPoolExecutor(max_workers=self._parallel_calls) as executor:
             futures = {
-                executor.submit(self._process_screenshot, f, regions, table_type): f
+                executor.submit(self._process_screenshot, f, regions, table_type, seat_mapping): f
                 for f in valid_files
             }
 
@@ -176,7 +168,6 @@ class ScreenshotWorker(QThread):
                         "hand_number": hand_number,
                         "table_type": table_type,
                         "position_names": position_names,
-                        "seat_names": seat_names,
                         "button_position": button_position,
                     })
                     self.result.emit(hand_number, path.name, len(position_names), len(seat_names))
@@ -184,6 +175,31 @@ class ScreenshotWorker(QThread):
         self.finished_processing.emit((ocr_data, ocr_results, ocr_errors))
 
 
+class DumpLoadWorker(QThread):
+    """Worker thread for loading OCR results from a dump file."""
+
+    finished_processing = Signal(object)  # ocr_data
+    error = Signal(str)  # message
+
+    def __init__(self, dump_path: Path, parent=None):
+        super().__init__(parent)
+        self._dump_path = dump_path
+        self._cancelled = False
+
+    def cancel(self) -> None:
+        self._cancelled = True
+
+    def run(self) -> None:
+        try:
+            ocr_data = parse_ocr_dump_to_ocr_data(self._dump_path)
+        except Exception as e:
+            if not self._cancelled:
+                self.error.emit(str(e))
+            return
+        if not self._cancelled:
+            self.finished_processing.emit(ocr_data)
+
+
 class ConversionWorker(QThread):
     """Worker thread for converting hand histories."""
 
@@ -212,7 +228,7 @@ class ConversionWorker(QThread):
         converted_dir = self._output_dir / "converted"
         skipped_dir = self._output_dir / "skipped"
 
-        txt_files = list(self._hands_dir.glob("*.txt"))
+        txt_files = _matching_files(self._hands_dir, "*.txt")
         total = len(txt_files)
         total_success = 0
         total_failed = 0
@@ -1,5 +1,7 @@
 """Hand history conversion - replaces encrypted IDs with real player names."""
+import functools
 import re
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TypedDict
@@ -27,6 +29,27 @@ class ConversionResult:
     replacements: dict[str, str] = field(default_factory=dict)
 
 
+@functools.lru_cache(maxsize=256)
+def _names_pattern(names: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile a whole-word alternation of names.
+
+    Cached because hands from the same table share their seat roster.
+    """
+    return re.compile(r"\b(?:" + "|".join(map(re.escape, names)) + r")\b")
+
+
+def _replace_names(text: str, replacements: dict[str, str]) -> str:
+    """Replace whole-word occurrences of each name in a single pass.
+
+    Longer names are tried first so an ID that prefixes another never
+    shadows it.
+    """
+    if not replacements:
+        return text
+    names = tuple(sorted(replacements, key=lambda name: (-len(name), name)))
+    return _names_pattern(names).sub(lambda m: replacements[m.group(0)], text)
+
+
 def convert_hand(
     hand: HandHistory,
     seat_to_name: dict[int, str],
@@ -42,7 +65,6 @@ def convert_hand(
     Returns:
         ConversionResult with converted text or error
     """
-    text = hand.raw_text
     replacements: dict[str, str] = {}
 
     for seat, encrypted_id in hand.seats.items():
@@ -56,17 +78,12 @@ def convert_hand(
         real_name = seat_to_name.get(seat)
         if real_name and real_name != "EMPTY":
             replacements[encrypted_id] = real_name
-            text = re.sub(
-                rf"\b{re.escape(encrypted_id)}\b",
-                real_name,
-                text,
-            )
 
     return ConversionResult(
         hand_number=hand.hand_number,
         success=True,
         original_text=hand.raw_text,
-        converted_text=text,
+        converted_text=_replace_names(hand.raw_text, replacements),
         replacements=replacements,
     )
 
@@ -194,8 +211,7 @@ def convert_hands_with_propagation(
             ))
             continue
 
-        # Apply replacements
-        text = hand.raw_text
+        # Collect replacements, then apply them in one pass
         replacements: dict[str, str] = {}
 
         # Replace encrypted IDs with real names (skip hero's seat)
@@ -205,18 +221,16 @@ def convert_hands_with_propagation(
             real_name = encrypted_to_name.get(encrypted_id)
             if real_name:
                 replacements[encrypted_id] = real_name
-                text = re.sub(rf"\b{re.escape(encrypted_id)}\b", real_name, text)
 
         # Replace hero's name (whatever it is: "Hero" or custom) with real name
         if hero_real_name and hero_player_name:
             replacements[hero_player_name] = hero_real_name
-            text = re.sub(rf"\b{re.escape(hero_player_name)}\b", hero_real_name, text)
 
         results.append(ConversionResult(
             hand_number=hand.hand_number,
             success=True,
             original_text=hand.raw_text,
-            converted_text=text,
+            converted_text=_replace_names(hand.raw_text, replacements),
             replacements=replacements,
         ))
 
@@ -224,45 +238,58 @@ def convert_hands_with_propagation(
 
 
 def write_converted_file(
-    results: list[ConversionResult],
+    results: Iterable[ConversionResult],
     output_path: Path,
 ) -> None:
     """Write successfully converted hands to output file.
 
+    Hands are written as they are consumed from results. The file is only
+    created once the first converted hand is seen.
+
     Args:
-        results: List of conversion results
+        results: Conversion results
         output_path: Path to write converted hands
     """
-    texts = [r.converted_text for r in results if r.success and r.converted_text]
-
-    if not texts:
-        return
-
-    content = "\n\n\n".join(texts)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(content, encoding="utf-8")
+    f = None
+    try:
+        for r in results:
+            if not (r.success and r.converted_text):
+                continue
+            if f is None:
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                f = output_path.open("w", encoding="utf-8")
+            else:
+                f.write("\n\n\n")
+            f.write(r.converted_text)
+    finally:
+        if f is not None:
+            f.close()
 
 
 def write_skipped_file(
-    results: list[ConversionResult],
+    results: Iterable[ConversionResult],
     output_path: Path,
 ) -> None:
     """Write skipped/failed hands with error log.
 
+    Hands are written as they are consumed from results. The file is only
+    created once the first failed hand is seen.
+
     Args:
-        results: List of conversion results
+        results: Conversion results
         output_path: Path to write skipped hands
     """
-    failed = [r for r in results if not r.success]
-
-    if not failed:
-        return
-
-    lines = []
-    for r in failed:
-        lines.append(f"# Hand {r.hand_number}: {r.error}")
-        lines.append(r.original_text)
-        lines.append("")
-
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text("\n".join(lines), encoding="utf-8")
+    f = None
+    try:
+        for r in results:
+            if r.success:
+                continue
+            if f is None:
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                f = output_path.open("w", encoding="utf-8")
+            else:
+                f.write("\n")
+            f.write(f"# Hand {r.hand_number}: {r.error}\n{r.original_text}\n")
+    finally:
+        if f is not None:
+            f.close()
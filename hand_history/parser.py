@@ -10,6 +10,8 @@ HAND_HEADER_PATTERN = re.compile(
 )
 TABLE_PATTERN = re.compile(r"^Table '([^']+)' (\d+)-max Seat #(\d+) is the button$")
 SEAT_PATTERN = re.compile(r"^Seat (\d+): (.+) \(\$[\d,.]+ in chips\)$")
+HAND_MARKER = "Poker Hand #"
+HAND_SEPARATOR = "\n\n" + HAND_MARKER
 
 
 @dataclass(frozen=True)
@@ -60,20 +62,20 @@ def parse_hand(text: str) -> HandHistory | None:
     seats: dict[int, str] = {}
 
     for line in lines[1:]:
+        # Dispatch on the prefix so each line runs at most one pattern
         if line.startswith("*** "):
             break
-
-        table_match = TABLE_PATTERN.match(line)
-        if table_match:
-            table_name = table_match.group(1)
-            button_seat = int(table_match.group(3))
-            continue
-
-        seat_match = SEAT_PATTERN.match(line)
-        if seat_match:
-            seat_num = int(seat_match.group(1))
-            player_name = seat_match.group(2)
-            seats[seat_num] = player_name
+        elif line.startswith("Seat "):
+            seat_match = SEAT_PATTERN.match(line)
+            if seat_match:
+                seat_num = int(seat_match.group(1))
+                player_name = seat_match.group(2)
+                seats[seat_num] = player_name
+        elif line.startswith("Table '"):
+            table_match = TABLE_PATTERN.match(line)
+            if table_match:
+                table_name = table_match.group(1)
+                button_seat = int(table_match.group(3))
 
     if not hand_number or not table_name:
         return None
@@ -101,10 +103,15 @@ def parse_file(path: Path) -> list[HandHistory]:
         raise FileNotFoundError(f"Hand history file not found: {path}")
 
     content = path.read_text(encoding="utf-8")
-    hand_blocks = re.split(r"\n{2,}(?=Poker Hand #)", content)
+
+    # Hands are separated by blank lines before each header. Splitting on the
+    # literal marker avoids a regex pass over the whole file; any extra blank
+    # lines stay on the previous block and are stripped below.
+    first, *rest = content.split(HAND_SEPARATOR)
+    blocks = [first] + [HAND_MARKER + part for part in rest]
 
     hands = []
-    for block in hand_blocks:
+    for block in blocks:
         block = block.strip()
         if not block:
             continue
@@ -3,11 +3,10 @@
 Handles the mapping between screenshot positions (bottom, top_left, etc.)
 and hand history seat numbers (1-6), accounting for GGPoker's view rotation.
 """
-import tomllib
 from enum import StrEnum
 from pathlib import Path
 
-from settings import get_user_data_path, get_bundled_path
+from settings import get_user_data_path, get_bundled_path, load_toml_cached
 
 
 class TableType(StrEnum):
@@ -87,15 +86,11 @@ def load_seat_mapping(table_type: str | TableType = TableType.SIX_PLAYER) -> dic
 
     user_path = get_user_data_path("seat_mapping.toml")
     if user_path.exists():
-        with open(user_path, "rb") as f:
-            data = tomllib.load(f)
-        return data.get(tt.value, default.copy())
+        return dict(load_toml_cached(user_path).get(tt.value, default))
 
     bundled_path = get_bundled_path("hand_history", "seat_mapping.toml")
     if bundled_path:
-        with open(bundled_path, "rb") as f:
-            data = tomllib.load(f)
-        return data.get(tt.value, default.copy())
+        return dict(load_toml_cached(bundled_path).get(tt.value, default))
 
     return default.copy()
 
@@ -211,11 +206,8 @@ def position_to_seat(
         # Last resort: static mapping
         mapping = seat_mapping or load_seat_mapping(tt)
 
-    result: dict[int, str] = {}
-
-    for position, player_name in position_names.items():
-        seat = mapping.get(position)
-        if seat is not None:
-            result[seat] = player_name
-
-    return result
+    return {
+        mapping[position]: name
+        for position, name in position_names.items()
+        if position in mapping
+    }
@@ -1,6 +1,7 @@
 from image_analyzer.models import (
     PlayerRegion,
     ScreenshotFilename,
+    FILENAME_PATTERN,
     FIVE_PLAYER_REGIONS,
     SIX_PLAYER_REGIONS,
 )
@@ -8,17 +9,35 @@ from image_analyzer.analyzer import (
     analyze_screenshot,
     analyze_screenshots_batch,
     analyze_image,
+    analyze_image_raw,
+    analyze_image_cached,
+    apply_corrections,
     detect_button_position,
 )
+from image_analyzer.cache import (
+    cache_key,
+    load_cached_names,
+    store_cached_names,
+)
+from image_analyzer.rate_limit import RateLimiter, call_with_backoff
 from image_analyzer.llm import LLMProvider, ProviderName, get_provider
 
 __all__ = [
     "analyze_screenshot",
     "analyze_screenshots_batch",
     "analyze_image",
+    "analyze_image_raw",
+    "analyze_image_cached",
+    "apply_corrections",
     "detect_button_position",
+    "cache_key",
+    "load_cached_names",
+    "store_cached_names",
+    "RateLimiter",
+    "call_with_backoff",
     "PlayerRegion",
     "ScreenshotFilename",
+    "FILENAME_PATTERN",
     "SIX_PLAYER_REGIONS",
     "FIVE_PLAYER_REGIONS",
     "LLMProvider",
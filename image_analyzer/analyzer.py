@@ -1,7 +1,6 @@
 """Image analysis using LLM providers (Anthropic Claude, DeepSeek)."""
 from pathlib import Path
 
-import cv2
 import numpy as np
 from PIL import Image, ImageEnhance
 
@@ -15,6 +14,8 @@ from image_analyzer.constants import (
     BUTTON_COLOR_BGR, BUTTON_COLOR_TOLERANCE,
 )
 from image_analyzer.models import PlayerRegion, SIX_PLAYER_REGIONS
+from image_analyzer.cache import cache_key, load_cached_names, store_cached_names
+from image_analyzer.rate_limit import RateLimiter, call_with_backoff
 from image_analyzer.llm import get_provider, ProviderName
 
 
@@ -83,6 +84,8 @@ def _extract_crops(
     Returns (combined_image, index_mapping) where index_mapping is
     [(region_name, y_position), ...].
     """
+    import cv2
+
     image_width = image.shape[1]
     label_height = 20
 
@@ -180,14 +183,36 @@ def _call_llm(
     provider: ProviderName = "anthropic",
     model: str | None = None,
 ) -> list[str]:
-    """Send image to LLM provider and get text for each crop."""
+    """Send image to LLM provider and get raw text for each crop."""
     llm = get_provider(provider, api_key, model)
     prompt = _build_prompt(num_crops)
     few_shot_examples = _get_few_shot_examples()
 
-    results = llm.call(image, num_crops, few_shot_examples, prompt)
+    return llm.call(image, num_crops, few_shot_examples, prompt)
+
+
+def apply_corrections(names: dict[str, str]) -> dict[str, str]:
+    """Replace known OCR misreads using the current corrections file."""
     corrections = load_corrections()
-    return [corrections.get(r, r) for r in results]
+    return {region: corrections.get(name, name) for region, name in names.items()}
+
+
+def analyze_image_raw(
+    image: np.ndarray,
+    regions: tuple[PlayerRegion, ...] = SIX_PLAYER_REGIONS,
+    api_key: str | None = None,
+    provider: ProviderName = "anthropic",
+    model: str | None = None,
+) -> dict[str, str]:
+    """Like analyze_image, but without applying OCR corrections.
+
+    This is what gets cached, so corrections added later still apply to
+    screenshots analyzed before.
+    """
+    batch_image, index_mapping = _extract_crops(image, regions)
+    results = _call_llm(batch_image, len(regions), api_key, provider, model)
+
+    return {region_name: results[idx] for idx, (region_name, _) in enumerate(index_mapping)}
 
 
 def analyze_image(
@@ -209,10 +234,50 @@ def analyze_image(
     Returns:
         Dict mapping region name to extracted player name
     """
-    batch_image, index_mapping = _extract_crops(image, regions)
-    results = _call_llm(batch_image, len(regions), api_key, provider, model)
+    return apply_corrections(analyze_image_raw(image, regions, api_key, provider, model))
 
-    return {region_name: results[idx] for idx, (region_name, _) in enumerate(index_mapping)}
+
+def analyze_image_cached(
+    data: bytes,
+    regions: tuple[PlayerRegion, ...],
+    api_key: str | None,
+    rate_limiter: RateLimiter,
+    use_cache: bool = True,
+) -> tuple[dict[str, str], str | None]:
+    """Analyze encoded screenshot bytes, reusing OCR results cached on disk.
+
+    Raw LLM output is cached keyed by the screenshot bytes, so unchanged
+    screenshots skip the API on re-runs; corrections are applied after the
+    lookup so edits to them still take effect. API calls are rate limited
+    and retried with backoff.
+
+    Args:
+        data: Encoded image file contents
+        regions: Player region definitions
+        api_key: API key (uses provider-specific env var if None)
+        rate_limiter: Limiter shared by all concurrent calls
+        use_cache: Reuse OCR results cached on disk from earlier runs
+
+    Returns:
+        Tuple of (position_names, button_position)
+    """
+    import cv2
+
+    # Decoded from bytes read by Python: cv2.imread can't open non-ASCII
+    # paths on Windows
+    image = cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_COLOR)
+    if image is None:
+        raise ValueError("Could not load image")
+
+    key = cache_key(data, regions)
+    position_names = load_cached_names(key) if use_cache else None
+    if position_names is None:
+        position_names = call_with_backoff(
+            lambda: analyze_image_raw(image, regions, api_key),
+            rate_limiter,
+        )
+        store_cached_names(key, position_names)
+    return apply_corrections(position_names), detect_button_position(image, regions)
 
 
 def analyze_screenshot(
@@ -234,6 +299,8 @@ def analyze_screenshot(
     Returns:
         Dict mapping region name to extracted player name
     """
+    import cv2
+
     path = Path(image_path)
     if not path.exists():
         raise FileNotFoundError(f"Image not found: {path}")
@@ -270,6 +337,8 @@ def analyze_screenshots_batch(
     if not image_paths:
         return []
 
+    import cv2
+
     if regions is None:
         regions = SIX_PLAYER_REGIONS
 
@@ -310,7 +379,11 @@ def analyze_screenshots_batch(
         y_offset += crop.height
 
     total_crops = current_index
-    api_results = _call_llm(combined, total_crops, api_key, provider, model)
+    corrections = load_corrections()
+    api_results = [
+        corrections.get(r, r)
+        for r in _call_llm(combined, total_crops, api_key, provider, model)
+    ]
 
     results: list[dict[str, str]] = []
     for i, (_, regions) in enumerate(images_data):
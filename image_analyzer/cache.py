@@ -0,0 +1,58 @@
+"""Persistent disk cache for screenshot OCR results.
+
+Each LLM call is a network round-trip that costs API credits, so results are
+stored on disk keyed by a hash of the screenshot bytes, the regions used and
+the provider/model that read them. Re-running a conversion over the same
+screenshots then skips the API.
+
+Entries hold the raw LLM output; callers apply OCR corrections after the
+lookup so corrections edited later still take effect.
+"""
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from image_analyzer.models import PlayerRegion
+from settings.config import _get_app_data_dir
+
+
+def get_cache_dir() -> Path:
+    """Get the per-user cache directory for OCR results."""
+    return _get_app_data_dir() / "ocr_cache"
+
+
+def cache_key(
+    image_bytes: bytes,
+    regions: tuple[PlayerRegion, ...],
+    provider: str = "anthropic",
+    model: str | None = None,
+) -> str:
+    """Build a cache key from the raw image bytes, region layout and model.
+
+    Regions are part of the key so the same screenshot analyzed as a 5-player
+    and a 6-player table never shares an entry; provider and model so a
+    different model re-reads the screenshot.
+    """
+    digest = hashlib.blake2b(image_bytes, digest_size=16)
+    digest.update(repr((regions, provider, model)).encode())
+    return digest.hexdigest()
+
+
+def load_cached_names(key: str, cache_dir: Path | None = None) -> dict[str, str] | None:
+    """Load cached player names for a key, or None on a miss."""
+    path = (cache_dir or get_cache_dir()) / f"{key}.json"
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def store_cached_names(key: str, names: dict[str, str], cache_dir: Path | None = None) -> None:
+    """Store player names for a key, replacing any existing entry atomically."""
+    cache_dir = cache_dir or get_cache_dir()
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    path = cache_dir / f"{key}.json"
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(names), encoding="utf-8")
+    os.replace(tmp_path, path)
@@ -1,21 +1,15 @@
-import tomllib
-
-from settings import get_user_data_path, get_bundled_path
+from settings import get_user_data_path, get_bundled_path, load_toml_cached
 
 
 def load_corrections() -> dict[str, str]:
     """Load OCR corrections from TOML file. User file takes priority over bundled."""
     user_path = get_user_data_path("corrections.toml")
     if user_path.exists():
-        with open(user_path, "rb") as f:
-            data = tomllib.load(f)
-        return data.get("corrections", {})
+        return dict(load_toml_cached(user_path).get("corrections", {}))
 
     bundled_path = get_bundled_path("image_analyzer", "corrections.toml")
     if bundled_path:
-        with open(bundled_path, "rb") as f:
-            data = tomllib.load(f)
-        return data.get("corrections", {})
+        return dict(load_toml_cached(bundled_path).get("corrections", {}))
 
     return {}
 
@@ -1,4 +1,5 @@
 import base64
+import functools
 import io
 import os
 import re
@@ -13,6 +14,18 @@ def _image_to_base64(image: Image.Image) -> str:
     return base64.standard_b64encode(buffer.getvalue()).decode("utf-8")
 
 
+@functools.cache
+def _get_client(api_key: str | None):
+    """Get a shared client per API key.
+
+    The client is thread-safe and keeps a connection pool, so parallel workers
+    reuse open HTTPS connections instead of handshaking on every screenshot.
+    """
+    import anthropic
+
+    return anthropic.Anthropic(api_key=api_key)
+
+
 class AnthropicProvider:
     """Anthropic Claude API provider."""
 
@@ -32,9 +45,7 @@ class AnthropicProvider:
         prompt: str,
     ) -> list[str]:
         """Send image to Anthropic and return extracted text for each crop."""
-        import anthropic
-
-        client = anthropic.Anthropic(api_key=self.api_key)
+        client = _get_client(self.api_key)
         image_b64 = _image_to_base64(image)
 
         messages = []
@@ -36,7 +36,8 @@ class ScreenshotFilename:
     @classmethod
     def is_valid(cls, filename: str | Path) -> bool:
         """Check if filename matches expected pattern."""
-        return cls.parse(filename) is not None
+        name = Path(filename).name if isinstance(filename, Path) else filename
+        return FILENAME_PATTERN.match(name) is not None
 
     @property
     def stakes(self) -> str:
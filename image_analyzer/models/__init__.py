@@ -6,11 +6,12 @@ from .PlayerRegion import (
     FIVE_PLAYER_REGIONS,
     SIX_PLAYER_REGIONS,
 )
-from .ScreenshotFilename import ScreenshotFilename
+from .ScreenshotFilename import ScreenshotFilename, FILENAME_PATTERN
 
 __all__ = [
     "PlayerRegion",
     "ScreenshotFilename",
+    "FILENAME_PATTERN",
     "DEFAULT_BOX_WIDTH",
     "DEFAULT_BOX_HEIGHT",
     "BASE_WIDTH",
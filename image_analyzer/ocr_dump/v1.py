@@ -5,6 +5,7 @@ Note: Duplicate hand numbers overwrite previous entries.
 """
 import tomllib
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 
 import tomli_w
@@ -13,6 +14,10 @@ from hand_history import DEFAULT_SEAT_MAPPINGS, position_to_seat
 
 VERSION = "v1"
 
+_by_filename = itemgetter("filename")
+# tomli_w writes one small chunk per table; buffer them into few syscalls
+_WRITE_BUFFER_SIZE = 1024 * 1024
+
 
 def write(
     results: list[dict],
@@ -43,7 +48,7 @@ def write(
             "table_type": r["table_type"],
             "positions": r["position_names"],
         }
-        for r in sorted(results, key=lambda x: x["filename"])
+        for r in sorted(results, key=_by_filename)
     }
 
     data = {
@@ -61,10 +66,10 @@ def write(
     if errors:
         data["errors"] = {
             e["filename"]: e["error"]
-            for e in sorted(errors, key=lambda x: x["filename"])
+            for e in sorted(errors, key=_by_filename)
         }
 
-    with open(path, "wb") as f:
+    with open(path, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
         tomli_w.dump(data, f)
 
     return path
@@ -5,6 +5,7 @@ Preserves all screenshots even if same hand appears multiple times.
 """
 import tomllib
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 
 import tomli_w
@@ -14,6 +15,10 @@ from image_analyzer.models import ScreenshotFilename
 
 VERSION = "v2"
 
+_by_filename = itemgetter("filename")
+# tomli_w writes one small chunk per table; buffer them into few syscalls
+_WRITE_BUFFER_SIZE = 1024 * 1024
+
 
 def _make_key(hand_number: str, filename: str) -> str:
     """Create composite key from hand number and filename datetime."""
@@ -54,7 +59,7 @@ def write(
     path.parent.mkdir(parents=True, exist_ok=True)
 
     results_dict = {}
-    for r in sorted(results, key=lambda x: x["filename"]):
+    for r in sorted(results, key=_by_filename):
         entry = {
             "hand_number": r["hand_number"],
             "filename": r["filename"],
@@ -80,10 +85,10 @@ def write(
     if errors:
         data["errors"] = {
             e["filename"]: e["error"]
-            for e in sorted(errors, key=lambda x: x["filename"])
+            for e in sorted(errors, key=_by_filename)
         }
 
-    with open(path, "wb") as f:
+    with open(path, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
         tomli_w.dump(data, f)
 
     return path
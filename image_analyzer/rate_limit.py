@@ -0,0 +1,63 @@
+"""Client-side throttling and retry for LLM API calls.
+
+Shared by the GUI screenshot worker and the CLI so both stay under the
+provider's request rate and back off the same way when it still says 429.
+"""
+import threading
+import time
+from collections.abc import Callable
+from typing import TypeVar
+
+T = TypeVar("T")
+
+MAX_RETRIES = 5
+BASE_BACKOFF = 1.0  # seconds
+
+
+class RateLimiter:
+    """Spaces calls evenly to stay under a per-minute request cap.
+
+    Safe to share between threads.
+    """
+
+    def __init__(self, requests_per_minute: int):
+        if requests_per_minute < 1:
+            raise ValueError(
+                f"requests_per_minute must be at least 1, got {requests_per_minute}"
+            )
+        self._min_interval = 60.0 / requests_per_minute
+        self._lock = threading.Lock()
+        self._next_request_time = 0.0
+
+    def wait(self) -> None:
+        """Wait if needed to stay under the rate limit.
+
+        Each call reserves the next free request slot under the lock and
+        sleeps after releasing it, so threads don't queue behind a sleeper.
+        """
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_request_time)
+            self._next_request_time = slot + self._min_interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def call_with_backoff(
+    func: Callable[[], T],
+    rate_limiter: RateLimiter,
+    max_retries: int = MAX_RETRIES,
+    base_backoff: float = BASE_BACKOFF,
+) -> T:
+    """Call func under the rate limit with exponential backoff on rate limit errors."""
+    import anthropic
+
+    for attempt in range(max_retries):
+        rate_limiter.wait()
+        try:
+            return func()
+        except anthropic.RateLimitError:
+            if attempt == max_retries - 1:
+                raise
+            time.sleep(base_backoff * (2 ** attempt))
+    raise RuntimeError("No retries attempted")
@@ -3,6 +3,7 @@ from settings.config import (
     save_settings,
     get_user_data_path,
     get_bundled_path,
+    load_toml_cached,
 )
 
 __all__ = [
@@ -10,4 +11,5 @@ __all__ = [
     "save_settings",
     "get_user_data_path",
     "get_bundled_path",
+    "load_toml_cached",
 ]
@@ -1,3 +1,5 @@
+import copy
+import os
 import sys
 import tomllib
 from pathlib import Path
@@ -57,21 +59,65 @@ DEFAULT_SETTINGS: dict = {
     "last_output_folder": "",
     "parallel_api_calls": 5,
     "api_rate_limit_per_minute": 50,
+    "use_ocr_cache": True,
 }
 
 
+# (path, mtime_ns, size) of the last file read or written, and its parsed content
+_settings_cache: tuple[tuple[Path, int, int], dict] | None = None
+
+
+def _stat_key(path: Path) -> tuple[Path, int, int] | None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return path, st.st_mtime_ns, st.st_size
+
+
 def load_settings() -> dict:
-    """Load settings from settings.toml, return defaults if not found."""
+    """Load settings from settings.toml, return defaults if not found.
+
+    The parsed file is cached in memory and only re-read when its mtime or
+    size changes. Callers get their own copy and may mutate it freely.
+    """
+    global _settings_cache
     settings_path = _get_settings_path()
-    if settings_path.exists():
+    key = _stat_key(settings_path)
+    if key is None:
+        return DEFAULT_SETTINGS.copy()
+    if _settings_cache is None or _settings_cache[0] != key:
         with open(settings_path, "rb") as f:
-            return tomllib.load(f)
-    return DEFAULT_SETTINGS.copy()
+            _settings_cache = (key, tomllib.load(f))
+    return copy.deepcopy(_settings_cache[1])
 
 
 def save_settings(settings: dict) -> None:
     """Save settings to settings.toml in app data directory."""
+    global _settings_cache
     settings_path = _get_settings_path()
     settings_path.parent.mkdir(parents=True, exist_ok=True)
     with open(settings_path, "wb") as f:
         tomli_w.dump(settings, f)
+    key = _stat_key(settings_path)
+    _settings_cache = (key, copy.deepcopy(settings)) if key else None
+
+
+# Parsed data files by path, with the (path, mtime_ns, size) they were read at
+_toml_cache: dict[Path, tuple[tuple[Path, int, int], dict]] = {}
+
+
+def load_toml_cached(path: Path) -> dict:
+    """Parse a TOML file, reusing the last result while the file is unchanged.
+
+    The returned dict is shared between callers and must not be mutated.
+    """
+    key = _stat_key(path)
+    cached = _toml_cache.get(path)
+    if key is not None and cached is not None and cached[0] == key:
+        return cached[1]
+    with open(path, "rb") as f:
+        data = tomllib.load(f)
+    if key is not None:
+        _toml_cache[path] = (key, data)
+    return data
@@ -1,7 +1,12 @@
 """Tests for GUI components using pytest-qt."""
+import re
 from pathlib import Path
 from unittest.mock import patch
 
+import cv2
+import numpy as np
+import pytest
+from dotenv import dotenv_values
 from PySide6.QtWidgets import QLineEdit
 
 from gui.drop_zone import DropZone
@@ -16,6 +21,10 @@ from gui.settings_dialog import (
     save_corrections,
 )
 from gui.main_window import MainWindow
+from gui.workers import DumpLoadWorker, ScreenshotWorker
+from hand_history import TableType
+from image_analyzer import SIX_PLAYER_REGIONS, cache_key, store_cached_names
+from image_analyzer.ocr_dump import write_ocr_dump
 from gui.version import get_version, _read_pyproject_version
 
 
@@ -44,10 +53,15 @@ class TestVersion:
 
     def test_get_version_fallback_to_dev(self):
         from importlib.metadata import PackageNotFoundError
-        with patch("gui.version._read_pyproject_version", return_value=None):
-            with patch("gui.version.version", side_effect=PackageNotFoundError("oitnow2")):
-                version = get_version()
-                assert version == "dev"
+        # get_version is cached per process; bypass it for the patched lookup
+        get_version.cache_clear()
+        try:
+            with patch("gui.version._read_pyproject_version", return_value=None):
+                with patch("gui.version.version", side_effect=PackageNotFoundError("oitnow2")):
+                    version = get_version()
+                    assert version == "dev"
+        finally:
+            get_version.cache_clear()
 
 
 class TestDropZone:
@@ -117,6 +131,33 @@ class TestFileListWidget:
         assert widget.valid_count() == 1
         assert len(widget.get_valid_files()) == 1
 
+    def test_file_list_with_pattern_validator(self, qtbot, tmp_path):
+        (tmp_path / "valid.txt").touch()
+        (tmp_path / "invalid.txt").touch()
+
+        widget = FileListWidget("Files", validator=re.compile(r"^valid"))
+        qtbot.addWidget(widget)
+
+        assert widget.set_folder(tmp_path, "*.txt") == 1
+        assert widget.get_valid_files() == [tmp_path / "valid.txt"]
+
+    def test_file_list_validates_each_file_once(self, qtbot, tmp_path):
+        (tmp_path / "valid.txt").touch()
+        (tmp_path / "invalid.txt").touch()
+        calls = []
+
+        def validator(name: str) -> bool:
+            calls.append(name)
+            return name.startswith("valid")
+
+        widget = FileListWidget("Files", validator=validator)
+        qtbot.addWidget(widget)
+        widget.set_folder(tmp_path, "*.txt")
+
+        assert widget.valid_count() == 1
+        assert widget.get_valid_files() == [tmp_path / "valid.txt"]
+        assert sorted(calls) == ["invalid.txt", "valid.txt"]
+
     def test_file_list_refresh_signal(self, qtbot):
         widget = FileListWidget("Test")
         qtbot.addWidget(widget)
@@ -124,6 +165,19 @@ class TestFileListWidget:
         with qtbot.waitSignal(widget.refresh_clicked, timeout=1000):
             widget._refresh_btn.click()
 
+    def test_file_list_refresh_clicks_are_debounced(self, qtbot):
+        widget = FileListWidget("Test")
+        qtbot.addWidget(widget)
+        emitted = []
+        widget.refresh_clicked.connect(lambda: emitted.append(True))
+
+        with qtbot.waitSignal(widget.refresh_clicked, timeout=1000):
+            for _ in range(5):
+                widget._refresh_btn.click()
+        qtbot.wait(FileListWidget.REFRESH_DEBOUNCE_MS * 2)
+
+        assert len(emitted) == 1
+
     def test_file_list_refresh_rereads_folder(self, qtbot, tmp_path):
         (tmp_path / "file1.txt").touch()
 
@@ -136,6 +190,76 @@ class TestFileListWidget:
         widget.refresh()
         assert widget.count() == 2
 
+    def test_file_list_scan_folder_populates_async(self, qtbot, tmp_path):
+        (tmp_path / "valid.txt").touch()
+        (tmp_path / "invalid.txt").touch()
+
+        widget = FileListWidget("Files", validator=re.compile(r"^valid"))
+        qtbot.addWidget(widget)
+
+        with qtbot.waitSignal(widget.populated, timeout=2000) as blocker:
+            widget.scan_folder(tmp_path, "*.txt")
+
+        assert blocker.args == [1]
+        assert widget.count() == 2
+        assert widget.valid_count() == 1
+
+    def test_file_list_rescans_only_changed_folder(self, qtbot, tmp_path):
+        (tmp_path / "a.txt").touch()
+
+        widget = FileListWidget("Files")
+        qtbot.addWidget(widget)
+        with qtbot.waitSignal(widget.populated, timeout=2000):
+            widget.scan_folder(tmp_path, "*.txt")
+
+        # Unchanged folder: rows are kept and counts re-emitted without a listing
+        with patch("gui.file_list.scan_folder_files") as scan, \
+                qtbot.waitSignal(widget.populated, timeout=2000) as blocker:
+            widget.scan_folder(tmp_path, "*.txt")
+        assert blocker.args == [1]
+        scan.assert_not_called()
+
+        (tmp_path / "b.txt").touch()
+        with qtbot.waitSignal(widget.populated, timeout=2000) as blocker:
+            widget.scan_folder(tmp_path, "*.txt")
+        assert blocker.args == [2]
+
+    def test_file_list_forced_scan_ignores_mtime(self, qtbot, tmp_path):
+        (tmp_path / "a.txt").touch()
+
+        widget = FileListWidget("Files")
+        qtbot.addWidget(widget)
+        with qtbot.waitSignal(widget.populated, timeout=2000):
+            widget.scan_folder(tmp_path, "*.txt")
+
+        # Simulate a filesystem that didn't bump the directory mtime
+        with patch("gui.file_list._listing_key", return_value=widget._listing_key):
+            (tmp_path / "b.txt").touch()
+            with qtbot.waitSignal(widget.populated, timeout=2000) as blocker:
+                widget.scan_folder(tmp_path, "*.txt", force=True)
+        assert blocker.args == [2]
+
+    def test_file_list_scan_superseded_by_set_folder(self, qtbot, tmp_path):
+        first = tmp_path / "first"
+        second = tmp_path / "second"
+        first.mkdir()
+        second.mkdir()
+        (first / "a.txt").touch()
+        (first / "b.txt").touch()
+        (second / "c.txt").touch()
+
+        widget = FileListWidget("Files")
+        qtbot.addWidget(widget)
+        emitted = []
+        widget.populated.connect(emitted.append)
+
+        widget.scan_folder(first, "*.txt")
+        widget.set_folder(second, "*.txt")
+        qtbot.wait(200)
+
+        assert emitted == []
+        assert widget.get_files() == [second / "c.txt"]
+
     def test_file_list_handles_missing_folder(self, qtbot, tmp_path):
         widget = FileListWidget("Files")
         qtbot.addWidget(widget)
@@ -202,6 +326,19 @@ class TestSettingsDialog:
             for position, spinbox in spinboxes.items():
                 assert spinbox.value() == DEFAULT_SEATS[table_type][position]
 
+    def test_settings_dialog_reload_discards_edits(self, qtbot):
+        dialog = SettingsDialog()
+        qtbot.addWidget(dialog)
+        rows = dialog._corrections_table.rowCount()
+        key = dialog._api_key_input.text()
+
+        dialog._add_correction_row()
+        dialog._api_key_input.setText("unsaved-key")
+        dialog.reload()
+
+        assert dialog._corrections_table.rowCount() == rows
+        assert dialog._api_key_input.text() == key
+
     def test_settings_dialog_add_correction_row(self, qtbot):
         dialog = SettingsDialog()
         qtbot.addWidget(dialog)
@@ -236,6 +373,19 @@ class TestSettingsFunctions:
             loaded = load_api_key()
             assert loaded == "test-api-key-123"
 
+    def test_load_api_key_parses_env_file_once(self, tmp_path):
+        env_file = tmp_path / ".env"
+
+        with patch("gui.settings_dialog._get_env_path", return_value=env_file):
+            save_api_key("first-key")
+            with patch("gui.settings_dialog.dotenv_values", wraps=dotenv_values) as parse:
+                assert load_api_key() == "first-key"
+                assert load_api_key() == "first-key"
+                assert parse.call_count == 1
+
+            save_api_key("second-key")
+            assert load_api_key() == "second-key"
+
     def test_load_api_key_from_env_var(self, tmp_path, monkeypatch):
         env_file = tmp_path / ".env"
         monkeypatch.setenv("ANTHROPIC_API_KEY", "env-var-key")
@@ -272,6 +422,80 @@ class TestSettingsFunctions:
             assert loaded["BAD"] == "GOOD"
 
 
+class TestScreenshotWorker:
+    ARGS = (SIX_PLAYER_REGIONS, TableType.SIX_PLAYER, {"bottom": 1})
+
+    @pytest.fixture
+    def screenshot(self, tmp_path):
+        path = tmp_path / "2024-02-08_ 10-30_AM_$0.01_$0.02_#12345.png"
+        path.write_bytes(cv2.imencode(".png", np.zeros((10, 10, 3), np.uint8))[1].tobytes())
+        with patch("image_analyzer.cache.get_cache_dir", return_value=tmp_path / "cache"):
+            yield path
+
+    def test_cached_screenshot_skips_api(self, screenshot, tmp_path):
+        names = {"bottom": "Alice"}
+        store_cached_names(cache_key(screenshot.read_bytes(), SIX_PLAYER_REGIONS), names)
+        worker = ScreenshotWorker(tmp_path, tmp_path)
+
+        with patch("image_analyzer.analyzer.analyze_image_raw") as call:
+            result = worker._process_screenshot(screenshot, *self.ARGS)
+
+        call.assert_not_called()
+        assert result[3] == names
+        assert result[4] == {1: "Alice"}
+
+    def test_corrections_apply_to_cached_screenshot(self, screenshot, tmp_path):
+        worker = ScreenshotWorker(tmp_path, tmp_path)
+
+        with patch("image_analyzer.analyzer.analyze_image_raw", return_value={"bottom": "M0USE"}) as call:
+            with patch("image_analyzer.analyzer.load_corrections", return_value={}):
+                first = worker._process_screenshot(screenshot, *self.ARGS)
+            with patch("image_analyzer.analyzer.load_corrections", return_value={"M0USE": "MOUSE"}):
+                second = worker._process_screenshot(screenshot, *self.ARGS)
+
+        assert call.call_count == 1
+        assert first[3] == {"bottom": "M0USE"}
+        assert second[3] == {"bottom": "MOUSE"}
+
+    def test_cache_can_be_bypassed(self, screenshot, tmp_path):
+        store_cached_names(cache_key(screenshot.read_bytes(), SIX_PLAYER_REGIONS), {"bottom": "Alice"})
+        worker = ScreenshotWorker(tmp_path, tmp_path, use_cache=False)
+
+        with patch("image_analyzer.analyzer.analyze_image_raw", return_value={"bottom": "Bob"}) as call:
+            result = worker._process_screenshot(screenshot, *self.ARGS)
+
+        call.assert_called_once()
+        assert result[3] == {"bottom": "Bob"}
+
+
+class TestDumpLoadWorker:
+    def test_loads_dump(self, qtbot, tmp_path):
+        dump = write_ocr_dump(
+            results=[{
+                "hand_number": "OM1",
+                "filename": "a.png",
+                "table_type": "6_player",
+                "position_names": {"top": "Alice"},
+            }],
+            errors=[],
+            output_path=tmp_path,
+            screenshots_folder=tmp_path,
+        )
+
+        worker = DumpLoadWorker(dump)
+        with qtbot.waitSignal(worker.finished_processing, timeout=2000) as blocker:
+            worker.start()
+        worker.wait()
+
+        assert blocker.args[0]["OM1"]["position_names"] == {"top": "Alice"}
+
+    def test_reports_error(self, qtbot, tmp_path):
+        worker = DumpLoadWorker(tmp_path / "missing.toml")
+        with qtbot.waitSignal(worker.error, timeout=2000):
+            worker.start()
+        worker.wait()
+
+
 class TestMainWindow:
     def test_main_window_initial_state(self, qtbot, monkeypatch):
         monkeypatch.setattr("gui.main_window.load_settings", lambda: {})
@@ -305,9 +529,112 @@ class TestMainWindow:
         window = MainWindow()
         qtbot.addWidget(window)
 
-        window._on_screenshots_folder_changed(screenshots_dir)
-        window._on_hands_folder_changed(hands_dir)
+        # Folder scans run on the thread pool and report back via populated
+        with qtbot.waitSignals([window._screenshots_list.populated, window._hands_list.populated], timeout=2000):
+            window._on_screenshots_folder_changed(screenshots_dir)
+            window._on_hands_folder_changed(hands_dir)
         window._output_input.setText(str(output_dir))
         window._on_output_changed(str(output_dir))
 
         assert window._convert_btn.isEnabled()
+
+    def test_output_folder_setting_is_debounced(self, qtbot, tmp_path, monkeypatch):
+        saved = []
+        monkeypatch.setattr("gui.main_window.load_settings", lambda: {})
+        monkeypatch.setattr("gui.main_window.save_settings", lambda x: saved.append(dict(x)))
+
+        window = MainWindow()
+        qtbot.addWidget(window)
+
+        for name in ("o", "ou", "out"):
+            window._on_output_changed(str(tmp_path / name))
+        assert saved == []
+
+        qtbot.waitUntil(lambda: len(saved) == 1, timeout=2000)
+        assert saved[0]["last_output_folder"] == str(tmp_path / "out")
+
+    def test_log_lines_are_batched(self, qtbot, monkeypatch):
+        monkeypatch.setattr("gui.main_window.load_settings", lambda: {})
+
+        window = MainWindow()
+        qtbot.addWidget(window)
+
+        for i in range(3):
+            window._log_line(f"line {i}")
+        assert window._log.toPlainText() == ""
+
+        qtbot.waitUntil(lambda: window._log.toPlainText() != "", timeout=2000)
+        assert window._log.toPlainText().splitlines() == ["line 0", "line 1", "line 2"]
+
+    def test_log_lines_are_inserted_as_plain_text(self, qtbot, monkeypatch):
+        monkeypatch.setattr("gui.main_window.load_settings", lambda: {})
+
+        window = MainWindow()
+        qtbot.addWidget(window)
+
+        lines = ["first", "<html><body>502 Bad Gateway</body></html>", "  indented", "last"]
+        for line in lines:
+            window._log_line(line)
+        window._flush_log()
+
+        assert window._log.document().blockCount() == 4
+        assert window._log.toPlainText().splitlines() == lines
+
+    def test_settings_loaded_once(self, qtbot, tmp_path, monkeypatch):
+        loads = []
+        saved = []
+        monkeypatch.setattr("gui.main_window.load_settings", lambda: loads.append(1) or {})
+        monkeypatch.setattr("gui.main_window.save_settings", lambda x: saved.append(dict(x)))
+
+        window = MainWindow()
+        qtbot.addWidget(window)
+        window._on_hands_folder_changed(tmp_path)
+        window._on_ocr_dump_selected(tmp_path / "dump.toml")
+
+        assert len(loads) == 1
+        assert saved[-1]["last_hands_folder"] == str(tmp_path)
+        assert saved[-1]["last_ocr_dump_file"] == str(tmp_path / "dump.toml")
+
+    def test_restoring_output_folder_does_not_schedule_save(self, qtbot, tmp_path, monkeypatch):
+        monkeypatch.setattr(
+            "gui.main_window.load_settings", lambda: {"last_output_folder": str(tmp_path)}
+        )
+
+        window = MainWindow()
+        qtbot.addWidget(window)
+
+        qtbot.waitUntil(lambda: window._output_input.text() == str(tmp_path), timeout=2000)
+        assert window._output_folder == tmp_path
+        assert not window._output_save_timer.isActive()
+
+    def test_saved_folder_does_not_override_user_choice(self, qtbot, tmp_path, monkeypatch):
+        saved_dir = tmp_path / "saved"
+        saved_dir.mkdir()
+        monkeypatch.setattr(
+            "gui.main_window.load_settings", lambda: {"last_hands_folder": str(saved_dir)}
+        )
+        monkeypatch.setattr("gui.main_window.save_settings", lambda x: None)
+
+        window = MainWindow()
+        qtbot.addWidget(window)
+        window._on_hands_folder_changed(tmp_path)
+        window._apply_saved_folders({"last_hands_folder": saved_dir})
+
+        assert window._hands_folder == tmp_path
+
+    def test_progress_updates_are_coalesced(self, qtbot, monkeypatch):
+        monkeypatch.setattr("gui.main_window.load_settings", lambda: {})
+
+        window = MainWindow()
+        qtbot.addWidget(window)
+        bar = window._screenshots_progress_bar
+
+        for i in range(1, 5):
+            window._on_screenshot_progress(i, 10, f"{i}.png")
+        assert bar.value() != 4
+
+        qtbot.waitUntil(lambda: bar.value() == 4, timeout=2000)
+        assert window._status_label.text() == "Processing: 4.png (4/10)"
+
+        window._on_screenshot_progress(10, 10, "10.png")
+        assert bar.value() == 10
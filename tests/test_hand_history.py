@@ -23,6 +23,7 @@ from hand_history import (
     calculate_seat_mapping_from_hero,
     DEFAULT_SEAT_MAPPINGS,
 )
+from hand_history.converter import _names_pattern
 from image_analyzer.ocr_dump import parse_ocr_dump, CURRENT_VERSION
 
 TESTS_DIR = Path(__file__).parent
@@ -203,6 +204,20 @@ class TestConvertHand:
         result = convert_hand(hand, seat_to_name)
         assert result.converted_text.count("SmallBlindPlayer") >= 3
 
+    def test_replaced_names_are_not_replaced_again(self):
+        hand = parse_hand(SAMPLE_HAND)
+        seat_to_name = {2: "4a363869", 3: "b3f8e036"}
+        result = convert_hand(hand, seat_to_name)
+        assert "Seat 2: 4a363869 " in result.converted_text
+        assert "Seat 3: b3f8e036 " in result.converted_text
+
+    def test_reuses_pattern_for_same_roster(self):
+        hand = parse_hand(SAMPLE_HAND)
+        _names_pattern.cache_clear()
+        convert_hand(hand, {2: "Player1", 3: "Player2"})
+        convert_hand(hand, {3: "Other2", 2: "Other1"})
+        assert _names_pattern.cache_info().hits == 1
+
 
 class TestConvertHands:
     def test_converts_matching_hands(self):
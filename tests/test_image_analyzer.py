@@ -9,10 +9,18 @@ from image_analyzer import (
     PlayerRegion,
     ScreenshotFilename,
     analyze_screenshot,
+    analyze_image_cached,
     SIX_PLAYER_REGIONS,
     FIVE_PLAYER_REGIONS,
+    cache_key,
+    load_cached_names,
+    store_cached_names,
+    RateLimiter,
+    call_with_backoff,
 )
+from image_analyzer.llm.anthropic import _get_client
 import cv2
+import numpy as np
 
 TESTS_DIR = Path(__file__).parent
 IMAGES_DIR = TESTS_DIR / "images"
@@ -135,6 +143,72 @@ class TestFivePlayerRegions:
         assert "top" not in names
 
 
+class TestOcrCache:
+    def test_key_depends_on_regions(self):
+        data = b"png bytes"
+        assert cache_key(data, SIX_PLAYER_REGIONS) == cache_key(data, SIX_PLAYER_REGIONS)
+        assert cache_key(data, SIX_PLAYER_REGIONS) != cache_key(data, FIVE_PLAYER_REGIONS)
+        assert cache_key(data, SIX_PLAYER_REGIONS) != cache_key(b"other", SIX_PLAYER_REGIONS)
+
+    def test_key_depends_on_model(self):
+        data = b"png bytes"
+        assert cache_key(data, SIX_PLAYER_REGIONS) != cache_key(data, SIX_PLAYER_REGIONS, model="other")
+        assert cache_key(data, SIX_PLAYER_REGIONS) != cache_key(data, SIX_PLAYER_REGIONS, "deepseek")
+
+    def test_miss_returns_none(self, tmp_path):
+        assert load_cached_names("missing", tmp_path) is None
+
+    def test_roundtrip(self, tmp_path):
+        names = {"top": "Player1", "bottom": "EMPTY"}
+        store_cached_names("abc", names, tmp_path)
+        assert load_cached_names("abc", tmp_path) == names
+        assert [p.name for p in tmp_path.iterdir()] == ["abc.json"]
+
+    def test_corrections_apply_to_cached_results(self, tmp_path):
+        screenshot = tmp_path / "shot.png"
+        cv2.imwrite(str(screenshot), np.zeros((10, 10, 3), np.uint8))
+        limiter = RateLimiter(6000)
+
+        with patch("image_analyzer.cache.get_cache_dir", return_value=tmp_path / "cache"), \
+                patch("image_analyzer.analyzer.analyze_image_raw", return_value={"top": "M0USE"}) as analyze:
+            with patch("image_analyzer.analyzer.load_corrections", return_value={}):
+                first, _ = analyze_image_cached(screenshot.read_bytes(), SIX_PLAYER_REGIONS, None, limiter)
+            with patch("image_analyzer.analyzer.load_corrections", return_value={"M0USE": "MOUSE_FIXED"}):
+                second, _ = analyze_image_cached(screenshot.read_bytes(), SIX_PLAYER_REGIONS, None, limiter)
+
+        assert first == {"top": "M0USE"}
+        assert second == {"top": "MOUSE_FIXED"}
+        assert analyze.call_count == 1
+
+
+class TestRateLimit:
+    @pytest.mark.parametrize("requests_per_minute", [0, -5])
+    def test_rejects_non_positive_rate(self, requests_per_minute):
+        with pytest.raises(ValueError):
+            RateLimiter(requests_per_minute)
+
+    def test_reserves_spaced_slots(self):
+        limiter = RateLimiter(60)
+        sleeps = []
+        with patch("image_analyzer.rate_limit.time.sleep", side_effect=sleeps.append), \
+                patch("image_analyzer.rate_limit.time.monotonic", return_value=100.0):
+            for _ in range(3):
+                limiter.wait()
+
+        assert sleeps == [1.0, 2.0]
+
+    def test_retries_rate_limit_errors(self):
+        mock_module = MagicMock()
+        mock_module.RateLimitError = type("RateLimitError", (Exception,), {})
+        func = MagicMock(side_effect=[mock_module.RateLimitError("slow down"), "ok"])
+        with patch.dict(sys.modules, {"anthropic": mock_module}), \
+                patch("image_analyzer.rate_limit.time.sleep") as sleep:
+            assert call_with_backoff(func, RateLimiter(6000)) == "ok"
+
+        assert func.call_count == 2
+        sleep.assert_any_call(1.0)
+
+
 @pytest.fixture(scope="module")
 def expected_results():
     return load_expected_results()
@@ -173,8 +247,11 @@ def mock_anthropic():
     mock_client = MagicMock()
     mock_module.Anthropic.return_value = mock_client
 
+    # Drop clients cached by earlier tests so the mocked module is used
+    _get_client.cache_clear()
     with patch.dict(sys.modules, {"anthropic": mock_module}):
         yield mock_module, mock_client
+    _get_client.cache_clear()
 
 
 class TestIntegration:
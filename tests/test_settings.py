@@ -1,5 +1,5 @@
 import tomli_w
-from settings import load_settings, save_settings
+from settings import load_settings, save_settings, load_toml_cached
 from settings.config import DEFAULT_SETTINGS
 
 
@@ -48,6 +48,35 @@ class TestSaveSettings:
         loaded = load_settings()
         assert loaded == original
 
+    def test_cached_load_returns_independent_copy(self, tmp_path, monkeypatch):
+        test_path = tmp_path / "settings.toml"
+        monkeypatch.setattr("settings.config._get_settings_path", lambda: test_path)
+        save_settings({"section": {"key": "value"}})
+        loaded = load_settings()
+        loaded["section"]["key"] = "mutated"
+        assert load_settings() == {"section": {"key": "value"}}
+
+    def test_load_picks_up_external_changes(self, tmp_path, monkeypatch):
+        test_path = tmp_path / "settings.toml"
+        monkeypatch.setattr("settings.config._get_settings_path", lambda: test_path)
+        save_settings({"key": "value"})
+        assert load_settings() == {"key": "value"}
+        with open(test_path, "wb") as f:
+            tomli_w.dump({"key": "changed externally"}, f)
+        assert load_settings() == {"key": "changed externally"}
+
+
+class TestLoadTomlCached:
+    def test_reuses_parse_until_file_changes(self, tmp_path):
+        path = tmp_path / "data.toml"
+        path.write_text('key = "value"')
+        first = load_toml_cached(path)
+        assert first == {"key": "value"}
+        assert load_toml_cached(path) is first
+
+        path.write_text('key = "changed"')
+        assert load_toml_cached(path) == {"key": "changed"}
+
 
 class TestDefaultSettings:
     def test_default_settings_has_folder_keys(self):